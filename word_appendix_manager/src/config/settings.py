@@ -54,6 +54,7 @@ class AppSettings:
             "advanced": {
                 "enable_logging": True,
                 "log_level": "INFO",
+                "log_caller_info": True,
                 "temp_directory": str(Path.home() / "tmp" / "WordAppendixManager"),
                 "cleanup_temp_files": True,
                 "max_undo_levels": 10
@@ -3,15 +3,11 @@ Appendix Manager
 Coordinates between Word document operations and PDF handling to create appendices.
 """
 
-import sys
 import tempfile
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import shutil
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
 from utils.logger import get_logger, LoggerMixin
 from utils.exceptions import (
     AppendixError, WordDocumentError, PDFError, 
@@ -4,14 +4,11 @@ Manages PDF operations including page counting, merging, and processing.
 """
 
 import os
-import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, BinaryIO
 import tempfile
 import shutil
-
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+import threading
 
 from utils.logger import get_logger, LoggerMixin
 from utils.exceptions import (
@@ -25,6 +22,9 @@ try:
 except ImportError:
     PYMUPDF_AVAILABLE = False
 
+# PyMuPDF is not thread-safe; every MuPDF call in the process goes through this lock
+_MUPDF_LOCK = threading.RLock()
+
 try:
     from pypdf import PdfReader, PdfWriter, PdfMerger
     PYPDF_AVAILABLE = True
@@ -39,6 +39,9 @@ except ImportError:
 class PDFHandler(LoggerMixin):
     """Handles all PDF-related operations."""
     
+    # Image format of the bytes returned by get_pdf_thumbnail
+    THUMBNAIL_FORMAT = "PNG"
+    
     def __init__(self, settings=None):
         self.settings = settings
         self.temp_dir = None
@@ -113,6 +116,11 @@ class PDFHandler(LoggerMixin):
     
     def _get_pdf_info_pymupdf(self, pdf_path: Path) -> Dict[str, Any]:
         """Get PDF info using PyMuPDF."""
+        with _MUPDF_LOCK:
+            return self._read_pdf_info_pymupdf(pdf_path)
+    
+    def _read_pdf_info_pymupdf(self, pdf_path: Path) -> Dict[str, Any]:
+        """Read PDF info with PyMuPDF; the caller holds _MUPDF_LOCK."""
         doc = fitz.open(str(pdf_path))
         try:
             info = {
@@ -183,44 +191,58 @@ class PDFHandler(LoggerMixin):
             
             return info
     
-    def get_pdf_thumbnail(self, pdf_path: str, page_number: int = 0) -> Optional[bytes]:
-        """Generate a thumbnail image of a PDF page."""
+    def get_pdf_thumbnail(self, pdf_path: str, page_number: int = 0,
+                          max_width: Optional[int] = None, max_height: Optional[int] = None) -> Optional[bytes]:
+        """Generate a thumbnail image of a PDF page.
+        
+        The page is rendered once, directly at the largest size that fits
+        max_width x max_height pixels (200 x 200 when not given).
+        """
         if not PYMUPDF_AVAILABLE:
             self.logger.warning("Thumbnail generation requires PyMuPDF")
             return None
         
         try:
-            doc = fitz.open(pdf_path)
-            try:
-                if page_number >= doc.page_count:
-                    page_number = 0
-                
-                page = doc[page_number]
-                
-                # Create thumbnail with max dimension of 200px
-                mat = fitz.Matrix(1, 1)
-                pix = page.get_pixmap(matrix=mat)
-                
-                # Scale down if necessary
-                max_dimension = 200
-                if pix.width > max_dimension or pix.height > max_dimension:
-                    scale = min(max_dimension / pix.width, max_dimension / pix.height)
-                    mat = fitz.Matrix(scale, scale)
-                    pix = page.get_pixmap(matrix=mat)
-                
-                # Convert to PNG bytes
-                thumbnail_bytes = pix.tobytes("png")
-                
-                self.logger.debug(f"Generated thumbnail for {Path(pdf_path).name}")
-                return thumbnail_bytes
-                
-            finally:
-                doc.close()
+            with _MUPDF_LOCK:
+                return self._render_thumbnail(pdf_path, page_number, max_width, max_height)
                 
         except Exception as e:
             self.logger.error(f"Failed to generate thumbnail for {pdf_path}: {e}")
             return None
     
+    def _render_thumbnail(self, pdf_path: str, page_number: int,
+                          max_width: Optional[int], max_height: Optional[int]) -> bytes:
+        """Render a thumbnail with PyMuPDF; the caller holds _MUPDF_LOCK."""
+        doc = fitz.open(pdf_path)
+        try:
+            if page_number >= doc.page_count:
+                page_number = 0
+            
+            page = doc[page_number]
+            
+            # Pick the zoom from the page size in points (72 per inch), so the
+            # page is rasterized once at the target size
+            if max_width or max_height:
+                zoom = min(
+                    (max_width or max_height) / page.rect.width,
+                    (max_height or max_width) / page.rect.height
+                )
+            else:
+                # Create thumbnail with max dimension of 200px
+                max_dimension = 200
+                zoom = min(1.0, max_dimension / page.rect.width, max_dimension / page.rect.height)
+            
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+            
+            # Convert to image bytes (PNG)
+            thumbnail_bytes = pix.tobytes(self.THUMBNAIL_FORMAT.lower())
+            
+            self.logger.debug(f"Generated thumbnail for {Path(pdf_path).name}")
+            return thumbnail_bytes
+            
+        finally:
+            doc.close()
+    
     def merge_pdfs(self, pdf_list: List[str], output_path: str) -> bool:
         """Merge multiple PDF files into one."""
         if not pdf_list:
@@ -258,6 +280,11 @@ class PDFHandler(LoggerMixin):
     
     def _merge_pdfs_pymupdf(self, pdf_list: List[str], output_path: str) -> bool:
         """Merge PDFs using PyMuPDF."""
+        with _MUPDF_LOCK:
+            return self._merge_pdfs_pymupdf_locked(pdf_list, output_path)
+    
+    def _merge_pdfs_pymupdf_locked(self, pdf_list: List[str], output_path: str) -> bool:
+        """Merge PDFs with PyMuPDF; the caller holds _MUPDF_LOCK."""
         output_doc = fitz.open()
         try:
             for pdf_path in pdf_list:
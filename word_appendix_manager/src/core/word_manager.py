@@ -5,15 +5,11 @@ and python-docx (macOS/fallback).
 """
 
 import os
-import sys
 import platform
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
 from utils.logger import get_logger, LoggerMixin
 from utils.exceptions import (
     WordDocumentError, WordNotAvailableError, WordDocumentNotFoundError,
@@ -40,12 +36,42 @@ except ImportError:
     DOCX_AVAILABLE = False
 
 
+class WordEventHandler:
+    """COM event sink for Word application events (see WordManager.watch_documents).
+    
+    Calls ``callback(quitting)`` whenever the set of open documents or their
+    saved state may have changed; ``quitting`` is True when Word is closing.
+    """
+    
+    callback = None
+    
+    def _notify(self, quitting: bool = False):
+        if self.callback:
+            self.callback(quitting)
+    
+    def OnDocumentOpen(self, doc):
+        self._notify()
+    
+    def OnNewDocument(self, doc):
+        self._notify()
+    
+    def OnDocumentBeforeClose(self, doc, cancel):
+        self._notify()
+    
+    def OnDocumentBeforeSave(self, doc, save_as_ui, cancel):
+        self._notify()
+    
+    def OnQuit(self):
+        self._notify(quitting=True)
+
+
 class WordManager(LoggerMixin):
     """Manages Microsoft Word document operations."""
     
     def __init__(self, settings=None):
         self.settings = settings
         self.word_app = None
+        self.word_events = None
         self.active_document = None
         self.document_path = None
         self.backup_created = False
@@ -90,6 +116,38 @@ class WordManager(LoggerMixin):
             self.logger.error(f"Failed to get open documents: {e}")
             return []
     
+    def watch_documents(self, callback) -> bool:
+        """Call ``callback(quitting)`` on Word document events (COM only).
+        
+        Only attaches to an already running Word instance. Events are delivered
+        in the calling thread, which must run a message loop (e.g. the Qt GUI
+        thread). Returns True if the event sink was attached.
+        """
+        if not self.com_available:
+            return False
+        
+        try:
+            if not self.word_app:
+                self.word_app = win32.GetActiveObject("Word.Application")
+            self.word_events = win32.WithEvents(self.word_app, WordEventHandler)
+            self.word_events.callback = callback
+            self.logger.info("Watching Word document events")
+            return True
+            
+        except Exception as e:
+            self.logger.debug(f"Cannot watch Word document events: {e}")
+            self.word_events = None
+            self.word_app = None
+            return False
+    
+    def unwatch_documents(self):
+        """Detach the event sink set up by watch_documents, releasing Word."""
+        if self.word_events is not None:
+            self.word_events.callback = None
+            self.word_events.close()
+            self.word_events = None
+        self.word_app = None
+    
     def open_document(self, document_path: str) -> bool:
         """Open a Word document for editing."""
         document_path = Path(document_path).resolve()
@@ -402,8 +460,7 @@ class WordManager(LoggerMixin):
     def close(self):
         """Clean up resources."""
         try:
-            if self.com_available and self.word_app:
-                self.word_app = None
+            self.unwatch_documents()
             
             self.active_document = None
             self.document_path = None
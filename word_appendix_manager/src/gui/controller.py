@@ -3,16 +3,13 @@ Application Controller
 Manages the communication between GUI and core business logic.
 """
 
-import sys
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
 from PySide6.QtCore import QObject, QThread, Signal, QTimer
 from PySide6.QtWidgets import QMessageBox, QProgressDialog, QApplication
 from PySide6.QtCore import Qt
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from functools import partial
 from concurrent.futures import ThreadPoolExecutor
 
 from utils.logger import get_logger, LoggerMixin
@@ -144,6 +141,12 @@ class AppController(QObject, LoggerMixin):
         self.current_document = None
         self.appendix_data = []
         
+        # PDF batches waiting to be processed and running totals for the summary
+        self._pdf_batches_queued = 0
+        self._pdf_added_count = 0
+        self._pdf_valid_count = 0
+        self._pdf_batch_errors = []  # Failures, reported in the one summary at the end
+        
         # Initialize components
         self.initialize_components()
         self.connect_signals()
@@ -195,14 +198,13 @@ class AppController(QObject, LoggerMixin):
                                         "error")
     
     def on_pdf_files_added(self, file_paths: List[str]):
-        """Handle adding PDF files as appendices."""
-        if not file_paths:
-            return
-        
-        self.main_window.show_progress("Processing PDF files...", 0)
+        """Handle a batch of PDF files added as appendices."""
+        self._pdf_batches_queued += 1
+        if file_paths:
+            self.main_window.show_progress("Processing PDF files...", 0)
         
         # Process files in a separate thread to avoid blocking UI
-        QTimer.singleShot(100, lambda: self._process_pdf_files(file_paths))
+        QTimer.singleShot(100, partial(self._process_pdf_files, file_paths))
     
     def _process_pdf_files(self, file_paths: List[str]):
         """Process PDF files in background."""
@@ -248,32 +250,59 @@ class AppController(QObject, LoggerMixin):
                     processed_files.append(appendix_data)
             
             # Add to appendix data
-            self.appendix_data.extend(processed_files)
-            
-            # Update main window
-            self.main_window.set_appendix_data(self.appendix_data)
-            self.main_window.hide_progress()
+            if processed_files:
+                self.appendix_data.extend(processed_files)
+                
+                # Update main window
+                self.main_window.set_appendix_data(self.appendix_data)
             
-            # Show summary
             valid_count = sum(1 for a in processed_files if a['valid'])
-            if valid_count == len(processed_files):
-                self.main_window.show_message("Files Added", 
-                                            f"Successfully added {len(processed_files)} PDF files", 
-                                            "info")
-            else:
-                invalid_count = len(processed_files) - valid_count
-                self.main_window.show_message("Files Added with Warnings", 
-                                            f"Added {len(processed_files)} files ({invalid_count} with warnings)", 
-                                            "warning")
+            self._pdf_added_count += len(processed_files)
+            self._pdf_valid_count += valid_count
             
             self.logger.info(f"Added {len(processed_files)} PDF files ({valid_count} valid)")
             
         except Exception as e:
-            self.main_window.hide_progress()
             self.logger.error(f"PDF processing failed: {e}")
-            self.main_window.show_message("Processing Error", 
-                                        f"Failed to process PDF files:\n{str(e)}", 
-                                        "error")
+            self._pdf_batch_errors.append(str(e))
+        
+        finally:
+            # Added paths are in the appendix list now, so duplicates are caught there
+            self.main_window.release_pdf_files(file_paths)
+            self._pdf_batches_queued -= 1
+            self._finish_pdf_batches()
+    
+    def _finish_pdf_batches(self):
+        """Hide progress and show a summary once the last PDF batch is processed."""
+        if self._pdf_batches_queued or self.main_window.has_pending_pdf_files():
+            return
+        
+        added_count, valid_count = self._pdf_added_count, self._pdf_valid_count
+        errors = self._pdf_batch_errors
+        self._pdf_added_count = self._pdf_valid_count = 0
+        self._pdf_batch_errors = []
+        
+        self.main_window.hide_progress()
+        
+        # Show summary; a failure replaces the usual summary, so one dialog reports it
+        if errors:
+            message = "Failed to process PDF files:\n" + "\n".join(errors)
+            if added_count:
+                message += f"\n\n{added_count} PDF files were added before the failure"
+            self.main_window.show_message("Processing Error", message, "error")
+        elif added_count == 0:
+            self.main_window.show_message("No Files Added", 
+                                        "None of the selected PDF files could be found", 
+                                        "warning")
+        elif valid_count == added_count:
+            self.main_window.show_message("Files Added", 
+                                        f"Successfully added {added_count} PDF files", 
+                                        "info")
+        else:
+            invalid_count = added_count - valid_count
+            self.main_window.show_message("Files Added with Warnings", 
+                                        f"Added {added_count} files ({invalid_count} with warnings)", 
+                                        "warning")
     
     def _generate_appendix_title(self, index: int) -> str:
         """Generate appendix title based on numbering style."""
@@ -466,9 +495,9 @@ class AppController(QObject, LoggerMixin):
         
         self.logger.info("Processing cancelled by user")
     
-    def get_appendix_data(self) -> List[Dict[str, Any]]:
-        """Get current appendix data."""
-        return self.appendix_data.copy()
+    def get_appendix_data(self) -> Tuple[Dict[str, Any], ...]:
+        """Get current appendix data as a read-only sequence (the dicts are shared)."""
+        return tuple(self.appendix_data)
     
     def set_appendix_data(self, data: List[Dict[str, Any]]):
         """Set appendix data."""
@@ -3,12 +3,8 @@ Appendix Edit Dialog
 Dialog for editing appendix properties and settings.
 """
 
-import sys
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QSpinBox, QComboBox, QPushButton, 
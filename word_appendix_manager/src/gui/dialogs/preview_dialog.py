@@ -3,12 +3,8 @@ Preview Dialog
 Shows a preview of changes that will be made to the document.
 """
 
-import sys
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
     QPushButton, QLabel, QGroupBox, QTextEdit, QSplitter, QFrame, QWidget
@@ -3,39 +3,48 @@ Settings Dialog
 Comprehensive settings dialog for configuring application preferences.
 """
 
-import sys
-from pathlib import Path
-
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QFormLayout, QGroupBox, QLineEdit, QSpinBox, QComboBox,
-    QPushButton, QCheckBox, QLabel, QFileDialog, QMessageBox
+    QPushButton, QCheckBox, QLabel
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QStringListModel
 from PySide6.QtGui import QFont
 from typing import Dict, Any
 
 from utils.logger import get_logger, LoggerMixin
 
+# Log level name -> index in the log level combo box
+_LOG_LEVEL_INDEX = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
+
 
 class SettingsDialog(QDialog, LoggerMixin):
     """Comprehensive settings dialog."""
     
     settings_changed = Signal()
     
+    # Tab titles with the (builder, loader) method names that fill each tab
+    _TABS = (
+        ("General", "create_general_tab", "_load_general_settings"),
+        ("Document", "create_document_tab", "_load_document_settings"),
+        ("PDF", "create_pdf_tab", "_load_pdf_settings"),
+        ("Advanced", "create_advanced_tab", "_load_advanced_settings"),
+    )
+    
     def __init__(self, settings, theme_manager=None, parent=None):
         super().__init__(parent)
         self.settings = settings
         self.theme_manager = theme_manager
         self.temp_settings = {}  # Store temporary changes
+        self._cached_font = None  # Last font shown in the font dialog
+        self._tabs_built = 0  # Number of tabs whose contents exist
         
         self.setup_ui()
-        self.load_settings()
         self.setup_connections()
         
+        # Fill the tabs during idle time so the dialog shell paints first
+        QTimer.singleShot(0, self._build_next_tab)
+        
         self.logger.info("Opened settings dialog")
     
     def setup_ui(self):
@@ -50,11 +59,14 @@ class SettingsDialog(QDialog, LoggerMixin):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Create tabs
-        self.create_general_tab()
-        self.create_document_tab()
-        self.create_pdf_tab()
-        self.create_advanced_tab()
+        # Create empty tab pages; their contents are built by _build_next_tab
+        self._tab_pages = []
+        for title, _, _ in self._TABS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, title)
+            self._tab_pages.append(page)
         
         # Dialog buttons
         buttons_layout = QHBoxLayout()
@@ -87,6 +99,30 @@ class SettingsDialog(QDialog, LoggerMixin):
         buttons_layout.addWidget(self.ok_btn)
         
         layout.addLayout(buttons_layout)
+
+    def _build_next_tab(self):
+        """Build and load the next unbuilt tab, then queue the one after it."""
+        if self._tabs_built >= len(self._TABS):
+            return
+        
+        _, builder, loader = self._TABS[self._tabs_built]
+        getattr(self, builder)()
+        getattr(self, loader)()
+        self._tabs_built += 1
+        
+        if self._tabs_built < len(self._TABS):
+            QTimer.singleShot(0, self._build_next_tab)
+        else:
+            self.setup_tab_connections()
+    
+    def _ensure_tabs_built(self):
+        """Synchronously build any tabs the idle-time chain has not reached yet."""
+        while self._tabs_built < len(self._TABS):
+            self._build_next_tab()
+
+    def _combo_model(self, items: list) -> QStringListModel:
+        """Get a string list model for a combo box, owned by this dialog."""
+        return QStringListModel(items, self)
     
     def create_general_tab(self):
         """Create the general settings tab."""
@@ -98,7 +134,7 @@ class SettingsDialog(QDialog, LoggerMixin):
         ui_layout = QFormLayout(ui_group)
         
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Light", "Dark", "System Default"])
+        self.theme_combo.setModel(self._combo_model(["Light", "Dark", "System Default"]))
         ui_layout.addRow("Theme:", self.theme_combo)
         
         self.show_preview_checkbox = QCheckBox("Show PDF preview panel")
@@ -148,7 +184,7 @@ class SettingsDialog(QDialog, LoggerMixin):
         layout.addWidget(behavior_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "General")
+        self._tab_pages[0].layout().addWidget(tab)
     
     def create_document_tab(self):
         """Create the document settings tab."""
@@ -160,10 +196,10 @@ class SettingsDialog(QDialog, LoggerMixin):
         numbering_layout = QFormLayout(numbering_group)
         
         self.numbering_style_combo = QComboBox()
-        self.numbering_style_combo.addItems([
+        self.numbering_style_combo.setModel(self._combo_model([
             "Alphabetical (A, B, C...)",
             "Numeric (1, 2, 3...)"
-        ])
+        ]))
         numbering_layout.addRow("Default Style:", self.numbering_style_combo)
         
         self.continue_numbering_checkbox = QCheckBox("Continue page numbering from main document")
@@ -204,7 +240,7 @@ class SettingsDialog(QDialog, LoggerMixin):
         layout.addWidget(processing_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Document")
+        self._tab_pages[1].layout().addWidget(tab)
     
     def create_pdf_tab(self):
         """Create the PDF settings tab."""
@@ -239,13 +275,13 @@ class SettingsDialog(QDialog, LoggerMixin):
         pdf_processing_layout.addRow("Orientation:", self.preserve_orientation_checkbox)
         
         self.compression_combo = QComboBox()
-        self.compression_combo.addItems(["Low", "Medium", "High"])
+        self.compression_combo.setModel(self._combo_model(["Low", "Medium", "High"]))
         pdf_processing_layout.addRow("Compression Level:", self.compression_combo)
         
         layout.addWidget(pdf_processing_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "PDF")
+        self._tab_pages[2].layout().addWidget(tab)
     
     def create_advanced_tab(self):
         """Create the advanced settings tab."""
@@ -260,7 +296,7 @@ class SettingsDialog(QDialog, LoggerMixin):
         logging_layout.addRow("Logging:", self.enable_logging_checkbox)
         
         self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
+        self.log_level_combo.setModel(self._combo_model(["DEBUG", "INFO", "WARNING", "ERROR"]))
         logging_layout.addRow("Log Level:", self.log_level_combo)
         
         layout.addWidget(logging_group)
@@ -282,10 +318,17 @@ class SettingsDialog(QDialog, LoggerMixin):
         layout.addWidget(performance_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Advanced")
+        self._tab_pages[3].layout().addWidget(tab)
     
     def setup_connections(self):
-        """Set up signal-slot connections."""
+        """Set up signal-slot connections for the dialog buttons."""
+        self.defaults_btn.clicked.connect(self.restore_defaults)
+        self.cancel_btn.clicked.connect(self.reject)
+        self.apply_btn.clicked.connect(self.apply_settings)
+        self.ok_btn.clicked.connect(self.accept_settings)
+    
+    def setup_tab_connections(self):
+        """Set up signal-slot connections for widgets inside the tabs."""
         # File browsers
         self.browse_last_dir_btn.clicked.connect(self.browse_last_directory)
         self.browse_backup_dir_btn.clicked.connect(self.browse_backup_directory)
@@ -293,12 +336,6 @@ class SettingsDialog(QDialog, LoggerMixin):
         
         # Font selection
         self.font_btn.clicked.connect(self.select_font)
-        
-        # Dialog buttons
-        self.defaults_btn.clicked.connect(self.restore_defaults)
-        self.cancel_btn.clicked.connect(self.reject)
-        self.apply_btn.clicked.connect(self.apply_settings)
-        self.ok_btn.clicked.connect(self.accept_settings)
 
         # Theme combo box - apply theme immediately on change 
         self.theme_combo.currentTextChanged.connect(self.on_theme_combo_changed)
@@ -314,7 +351,14 @@ class SettingsDialog(QDialog, LoggerMixin):
     
     def load_settings(self):
         """Load current settings into the dialog."""
-        # General tab
+        # Tabs built from here on load themselves; only reload the ones built before
+        built_before = self._tabs_built
+        self._ensure_tabs_built()
+        for _, _, loader in self._TABS[:built_before]:
+            getattr(self, loader)()
+    
+    def _load_general_settings(self):
+        """Load settings shown on the general tab."""
         theme = self.settings.ui_theme
         theme_index = {"light": 0, "dark": 1, "system": 2}.get(theme, 0)
         self.theme_combo.setCurrentIndex(theme_index)
@@ -327,8 +371,9 @@ class SettingsDialog(QDialog, LoggerMixin):
         
         self.auto_backup_checkbox.setChecked(self.settings.auto_backup_enabled)
         self.cleanup_temp_checkbox.setChecked(self.settings.get('advanced.cleanup_temp_files', True))
-        
-        # Document tab
+    
+    def _load_document_settings(self):
+        """Load settings shown on the document tab."""
         numbering_style = self.settings.appendix_numbering_style
         numbering_index = 0 if numbering_style == "alphabetical" else 1
         self.numbering_style_combo.setCurrentIndex(numbering_index)
@@ -345,8 +390,9 @@ class SettingsDialog(QDialog, LoggerMixin):
         self.italic_checkbox.setChecked(heading_style.get('italic', False))
         
         self.max_undo_spinbox.setValue(self.settings.get('advanced.max_undo_levels', 10))
-        
-        # PDF tab
+    
+    def _load_pdf_settings(self):
+        """Load settings shown on the PDF tab."""
         self.max_file_size_spinbox.setValue(self.settings.max_pdf_size_mb)
         self.max_pages_spinbox.setValue(self.settings.get('pdf.max_pages_warning', 2000))
         
@@ -356,21 +402,20 @@ class SettingsDialog(QDialog, LoggerMixin):
         compression_level = self.settings.get('pdf.compression_level', 'medium')
         compression_index = {"low": 0, "medium": 1, "high": 2}.get(compression_level, 1)
         self.compression_combo.setCurrentIndex(compression_index)
-        
-        # Advanced tab
+    
+    def _load_advanced_settings(self):
+        """Load settings shown on the advanced tab."""
         self.enable_logging_checkbox.setChecked(self.settings.get('advanced.enable_logging', True))
         
         log_level = self.settings.get('advanced.log_level', 'INFO')
-        try:
-            log_level_index = ["DEBUG", "INFO", "WARNING", "ERROR"].index(log_level)
-            self.log_level_combo.setCurrentIndex(log_level_index)
-        except ValueError:
-            self.log_level_combo.setCurrentIndex(1)  # Default to INFO
+        self.log_level_combo.setCurrentIndex(_LOG_LEVEL_INDEX.get(log_level, 1))  # Default to INFO
         
         self.temp_directory_edit.setText(self.settings.get('advanced.temp_directory', ''))
     
     def browse_last_directory(self):
         """Browse for last directory."""
+        from PySide6.QtWidgets import QFileDialog
+        
         directory = QFileDialog.getExistingDirectory(
             self, "Select Default Directory", self.last_directory_edit.text()
         )
@@ -379,6 +424,8 @@ class SettingsDialog(QDialog, LoggerMixin):
     
     def browse_backup_directory(self):
         """Browse for backup directory."""
+        from PySide6.QtWidgets import QFileDialog
+        
         directory = QFileDialog.getExistingDirectory(
             self, "Select Backup Directory", self.backup_directory_edit.text()
         )
@@ -387,6 +434,8 @@ class SettingsDialog(QDialog, LoggerMixin):
     
     def browse_temp_directory(self):
         """Browse for temp directory."""
+        from PySide6.QtWidgets import QFileDialog
+        
         directory = QFileDialog.getExistingDirectory(
             self, "Select Temp Directory", self.temp_directory_edit.text()
         )
@@ -397,16 +446,18 @@ class SettingsDialog(QDialog, LoggerMixin):
         """Select font for appendix headings."""
         from PySide6.QtWidgets import QFontDialog
         
-        heading_style = self.settings.heading_style
-        current_font = QFont(
-            heading_style.get('font_name', 'Arial'),
-            heading_style.get('font_size', 14)
-        )
-        current_font.setBold(heading_style.get('bold', True))
-        current_font.setItalic(heading_style.get('italic', False))
+        if self._cached_font is None:
+            heading_style = self.settings.heading_style
+            self._cached_font = QFont(
+                heading_style.get('font_name', 'Arial'),
+                heading_style.get('font_size', 14)
+            )
+            self._cached_font.setBold(heading_style.get('bold', True))
+            self._cached_font.setItalic(heading_style.get('italic', False))
         
-        font, ok = QFontDialog.getFont(current_font, self)  
+        font, ok = QFontDialog.getFont(self._cached_font, self)  
         if ok:
+            self._cached_font = font
             self.font_label.setText(f"{font.family()}, {font.pointSize()}pt")
             
             # Store font info for later
@@ -417,6 +468,8 @@ class SettingsDialog(QDialog, LoggerMixin):
     
     def restore_defaults(self):
         """Restore all settings to defaults."""
+        from PySide6.QtWidgets import QMessageBox
+        
         reply = QMessageBox.question(
             self, "Restore Defaults", 
             "Are you sure you want to restore all settings to their default values?",
@@ -425,6 +478,7 @@ class SettingsDialog(QDialog, LoggerMixin):
         
         if reply == QMessageBox.Yes:
             self.settings.reset_to_defaults()
+            self._cached_font = None
             self.load_settings()
             QMessageBox.information(self, "Defaults Restored", "All settings have been reset to defaults.")
     
@@ -441,31 +495,35 @@ class SettingsDialog(QDialog, LoggerMixin):
     
     def save_settings(self):
         """Save settings from dialog to settings object."""
+        self._ensure_tabs_built()
+        
+        settings = self.settings
+        sset = settings.set
+        
         # General settings
         theme_map = {0: "light", 1: "dark", 2: "system"}
-        theme_map = {0: "light", 1: "dark", 2: "system"}
         theme_name = theme_map[self.theme_combo.currentIndex()]
-        self.settings.ui_theme = theme_name
+        settings.ui_theme = theme_name
         
         # Save theme through theme manager
         if self.theme_manager:
             self.theme_manager.save_theme_preference(theme_name)
             self.theme_manager.load_theme(theme_name)
 
-        self.settings.set('ui.show_pdf_preview', self.show_preview_checkbox.isChecked())
-        self.settings.set('ui.drag_drop_enabled', self.drag_drop_checkbox.isChecked())
+        sset('ui.show_pdf_preview', self.show_preview_checkbox.isChecked())
+        sset('ui.drag_drop_enabled', self.drag_drop_checkbox.isChecked())
         
-        self.settings.last_directory = self.last_directory_edit.text()
-        self.settings.set('document.backup_directory', self.backup_directory_edit.text())
+        settings.last_directory = self.last_directory_edit.text()
+        sset('document.backup_directory', self.backup_directory_edit.text())
         
-        self.settings.set('document.auto_backup', self.auto_backup_checkbox.isChecked())
-        self.settings.set('advanced.cleanup_temp_files', self.cleanup_temp_checkbox.isChecked())
+        sset('document.auto_backup', self.auto_backup_checkbox.isChecked())
+        sset('advanced.cleanup_temp_files', self.cleanup_temp_checkbox.isChecked())
         
         # Document settings
         numbering_style = "alphabetical" if self.numbering_style_combo.currentIndex() == 0 else "numeric"
-        self.settings.set('document.appendix_numbering_style', numbering_style)
+        sset('document.appendix_numbering_style', numbering_style)
         
-        self.settings.set('document.continue_page_numbering', self.continue_numbering_checkbox.isChecked())
+        sset('document.continue_page_numbering', self.continue_numbering_checkbox.isChecked())
         
         # Font settings
         font_family = self.temp_settings.get('font_family', 'Arial')
@@ -477,34 +535,34 @@ class SettingsDialog(QDialog, LoggerMixin):
             'bold': self.bold_checkbox.isChecked(),
             'italic': self.italic_checkbox.isChecked()
         }
-        self.settings.set('document.heading_style', heading_style)
+        sset('document.heading_style', heading_style)
         
-        self.settings.set('advanced.max_undo_levels', self.max_undo_spinbox.value())
+        sset('advanced.max_undo_levels', self.max_undo_spinbox.value())
         
         # PDF settings
-        self.settings.set('pdf.max_file_size_mb', self.max_file_size_spinbox.value())
-        self.settings.set('pdf.max_pages_warning', self.max_pages_spinbox.value())
+        sset('pdf.max_file_size_mb', self.max_file_size_spinbox.value())
+        sset('pdf.max_pages_warning', self.max_pages_spinbox.value())
         
-        self.settings.set('pdf.scale_to_fit', self.scale_to_fit_checkbox.isChecked())
-        self.settings.set('pdf.preserve_orientation', self.preserve_orientation_checkbox.isChecked())
+        sset('pdf.scale_to_fit', self.scale_to_fit_checkbox.isChecked())
+        sset('pdf.preserve_orientation', self.preserve_orientation_checkbox.isChecked())
         
         compression_map = {0: "low", 1: "medium", 2: "high"}
         compression_level = compression_map[self.compression_combo.currentIndex()]
-        self.settings.set('pdf.compression_level', compression_level)
+        sset('pdf.compression_level', compression_level)
         
         # Advanced settings
-        self.settings.set('advanced.enable_logging', self.enable_logging_checkbox.isChecked())
+        sset('advanced.enable_logging', self.enable_logging_checkbox.isChecked())
         
         log_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
         log_level = log_levels[self.log_level_combo.currentIndex()]
-        self.settings.set('advanced.log_level', log_level)
+        sset('advanced.log_level', log_level)
         
         temp_dir = self.temp_directory_edit.text()
         if temp_dir:
-            self.settings.set('advanced.temp_directory', temp_dir)
+            sset('advanced.temp_directory', temp_dir)
         
         # Save to file
-        self.settings.save_settings()
+        settings.save_settings()
         self.logger.info("Settings saved successfully")
     
     def closeEvent(self, event):
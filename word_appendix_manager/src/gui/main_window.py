@@ -3,20 +3,23 @@ Main Window
 The primary user interface for the Word Appendix Manager application.
 """
 
-import sys
+import os
+import copy
+import importlib
+from collections import deque
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QLabel, QComboBox, QPushButton, QTextEdit, QProgressBar, 
-    QStatusBar, QMenuBar, QMenu, QGroupBox, QFrame, QMessageBox, QDialog
+    QStatusBar, QMenuBar, QMenu, QGroupBox, QFrame, QMessageBox, QDialog,
+    QStackedWidget, QFileDialog
+)
+from PySide6.QtCore import (
+    Qt, QSize, Signal, Slot, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker
 )
-from PySide6.QtCore import Qt, QSize, Signal, QTimer
-from PySide6.QtGui import QAction, QIcon
-from typing import Optional, Dict, Any, List
+from PySide6.QtGui import QAction, QIcon, QTextDocument, QTextCursor
+from typing import Optional, Dict, Any, List, Tuple
 
 from utils.logger import get_logger, LoggerMixin
 from gui.widgets.document_selector import DocumentSelectorWidget
@@ -24,6 +27,118 @@ from gui.widgets.appendix_list_widget import AppendixListWidget
 from gui.widgets.drag_drop_area import DragDropArea
 from gui.widgets.pdf_preview_widget import PDFPreviewWidget
 
+try:
+    import orjson  # Optional, much faster project file (de)serialization
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# Dialog classes, imported from gui.dialogs the first time one is opened
+_DIALOG_CLASSES = {}
+
+
+def _lazy_dialog(name: str):
+    """Get a dialog class from gui.dialogs, importing the package on first use."""
+    dialog_class = _DIALOG_CLASSES.get(name)
+    if dialog_class is None:
+        dialog_class = _DIALOG_CLASSES[name] = getattr(importlib.import_module('gui.dialogs'), name)
+    return dialog_class
+
+
+# File dialog filter for appendix PDFs
+PDF_FILE_FILTER = "PDF Files (*.pdf)"
+
+# Number of PDF paths checked and emitted per pdf_files_added batch
+PDF_BATCH_SIZE = 8
+
+
+class PDFPathFilterSignals(QObject):
+    """Signals for PDFPathFilter; QRunnable cannot emit signals itself."""
+    
+    paths_filtered = Signal(list, list)  # Existing files, missing paths
+
+
+class PDFPathFilter(QRunnable):
+    """Thread pool task that checks a batch of PDF paths off the GUI thread."""
+    
+    def __init__(self, signals: PDFPathFilterSignals, file_paths: List[str]):
+        super().__init__()
+        self.signals = signals
+        self.file_paths = file_paths
+    
+    def run(self):
+        """Stat each path and report which ones are usable files."""
+        existing, missing = [], []
+        for file_path in self.file_paths:
+            try:
+                is_file = Path(file_path).is_file()
+            except OSError:
+                is_file = False
+            (existing if is_file else missing).append(file_path)
+        
+        self.signals.paths_filtered.emit(existing, missing)
+
+
+def dump_project_json(project_data: Dict[str, Any]) -> bytes:
+    """Serialize project data to indented UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(project_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(project_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def load_project_json(data: bytes) -> Dict[str, Any]:
+    """Parse project data from UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+class ProjectFileSignals(QObject):
+    """Signals for the project file tasks; QRunnable cannot emit signals itself."""
+    
+    project_loaded = Signal(str, object)       # File path, project data
+    project_saved = Signal(str)                # File path
+    project_failed = Signal(str, str, str)     # Operation, file path, error message
+
+
+class ProjectLoadTask(QRunnable):
+    """Thread pool task that reads and parses a project file."""
+    
+    def __init__(self, signals: ProjectFileSignals, file_path: str):
+        super().__init__()
+        self.signals = signals
+        self.file_path = file_path
+    
+    def run(self):
+        """Read the project file in a pool thread."""
+        try:
+            with open(self.file_path, 'rb') as f:
+                project_data = load_project_json(f.read())
+            self.signals.project_loaded.emit(self.file_path, project_data)
+        except Exception as e:
+            self.signals.project_failed.emit("load", self.file_path, str(e))
+
+
+class ProjectSaveTask(QRunnable):
+    """Thread pool task that writes serialized project data to a file."""
+    
+    def __init__(self, signals: ProjectFileSignals, file_path: str, data: bytes):
+        super().__init__()
+        self.signals = signals
+        self.file_path = file_path
+        self.data = data
+    
+    def run(self):
+        """Write the project file in a pool thread."""
+        try:
+            with open(self.file_path, 'wb') as f:
+                f.write(self.data)
+            self.signals.project_saved.emit(self.file_path)
+        except Exception as e:
+            self.signals.project_failed.emit("save", self.file_path, str(e))
+
+
 class MainWindow(QMainWindow, LoggerMixin):
     """Main application window."""
     
@@ -37,8 +152,47 @@ class MainWindow(QMainWindow, LoggerMixin):
         super().__init__(parent)
         self.settings = settings
         self.theme_manager = theme_manager
+        
+        # Settings read on hot paths; refreshed in apply_settings and written through on change
+        self._last_directory = settings.last_directory if settings else ""
+        self._auto_backup = settings.auto_backup_enabled if settings else True
+        
         self.current_document = None
         self.appendix_data = []
+        self._numbering_style_cached = None  # Style the appendix list was last rendered with
+        
+        # Debounce preview loads so fast keyboard navigation only renders the settled selection
+        self._pending_preview_appendix = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(120)
+        self._preview_timer.timeout.connect(self._do_load_preview)
+        
+        # PDF paths waiting to be checked and emitted in batches
+        self._pending_pdf_paths = deque()
+        # Duplicate-check keys of every added path not yet in the appendix list:
+        # queued, being checked, or emitted and waiting for the controller
+        self._in_flight_pdf_keys = set()
+        self._pdf_filter_running = False
+        self._pdf_filter_signals = PDFPathFilterSignals(self)
+        self._pdf_filter_signals.paths_filtered.connect(self._on_pdf_paths_filtered, Qt.QueuedConnection)
+        self._pdf_batch_timer = QTimer(self)
+        self._pdf_batch_timer.setSingleShot(True)
+        self._pdf_batch_timer.setInterval(0)
+        self._pdf_batch_timer.timeout.connect(self._start_next_pdf_batch)
+        
+        # Count label and process buttons are refreshed at most once per event loop turn
+        self._ui_dirty = False
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setSingleShot(True)
+        self._ui_update_timer.setInterval(0)
+        self._ui_update_timer.timeout.connect(self._flush_ui_updates)
+        
+        # Project files are read and written in the thread pool
+        self._project_signals = ProjectFileSignals(self)
+        self._project_signals.project_loaded.connect(self.on_project_loaded, Qt.QueuedConnection)
+        self._project_signals.project_saved.connect(self.on_project_saved, Qt.QueuedConnection)
+        self._project_signals.project_failed.connect(self.on_project_failed, Qt.QueuedConnection)
         
         # Initialize UI
         self.setup_ui()
@@ -49,9 +203,10 @@ class MainWindow(QMainWindow, LoggerMixin):
         
         self.logger.info("Main window initialized")
 
+    @Slot(str)
     def on_theme_changed(self, theme_name: str):
         """Handle theme change event."""
-        self.logger.info(f"Theme changed to: {theme_name}")
+        self.logger.info("Theme changed to: %s", theme_name)
         # The theme is already applied globally by ThemeManager
         # We can add any window-specific updates here if needed
         self.update()
@@ -176,8 +331,14 @@ class MainWindow(QMainWindow, LoggerMixin):
         preview_group = QGroupBox("PDF Preview")
         preview_layout = QVBoxLayout(preview_group)
         
-        self.pdf_preview = PDFPreviewWidget()
-        preview_layout.addWidget(self.pdf_preview)
+        # The preview widget is created on first selection (see _ensure_preview)
+        self._preview_stack = QStackedWidget()
+        self._preview_placeholder = QLabel("Preview will load on first selection")
+        self._preview_placeholder.setAlignment(Qt.AlignCenter)
+        self._preview_placeholder.setStyleSheet("color: #999; font-style: italic;")
+        self._preview_stack.addWidget(self._preview_placeholder)
+        self.pdf_preview = None
+        preview_layout.addWidget(self._preview_stack)
         
         layout.addWidget(preview_group)
         
@@ -188,7 +349,8 @@ class MainWindow(QMainWindow, LoggerMixin):
         self.details_text = QTextEdit()
         self.details_text.setReadOnly(True)
         self.details_text.setMaximumHeight(150)
-        self.details_text.setHtml("<i>Select an appendix to view details</i>")
+        self.create_details_documents()
+        self.show_details_placeholder()
         details_layout.addWidget(self.details_text)
         
         layout.addWidget(details_group)
@@ -352,6 +514,8 @@ class MainWindow(QMainWindow, LoggerMixin):
         # Appendix list connections
         self.appendix_list.selection_changed.connect(self.on_appendix_selected)
         self.appendix_list.item_double_clicked.connect(self.edit_appendix)
+        self.appendix_list.items_reordered.connect(self.on_appendix_reordered)
+        self.appendix_list.appendices_updated.connect(self.on_appendix_list_updated)
         
         # Button connections
         self.move_up_btn.clicked.connect(self.move_appendix_up)
@@ -361,7 +525,7 @@ class MainWindow(QMainWindow, LoggerMixin):
         self.process_btn.clicked.connect(self.process_appendices)
         
         # Settings connections
-        self.numbering_combo.currentTextChanged.connect(self.on_numbering_changed)
+        self.numbering_combo.currentIndexChanged.connect(self.on_numbering_changed)
         self.backup_checkbox.toggled.connect(self.on_backup_setting_changed)
 
         # Theme manager connection
@@ -379,39 +543,110 @@ class MainWindow(QMainWindow, LoggerMixin):
         if maximized:
             self.showMaximized()
         
-        # Numbering style
-        numbering_style = self.settings.appendix_numbering_style
-        if numbering_style == "numeric":
-            self.numbering_combo.setCurrentIndex(1)
-        else:
-            self.numbering_combo.setCurrentIndex(0)
+        # Numbering style; the combo is updated silently and the list only re-rendered if the style changed
+        numbering_style = "numeric" if self.settings.appendix_numbering_style == "numeric" else "alphabetical"
+        with QSignalBlocker(self.numbering_combo):
+            self.numbering_combo.setCurrentIndex(1 if numbering_style == "numeric" else 0)
+        if numbering_style != self._numbering_style_cached:
+            self._numbering_style_cached = numbering_style
+            self.appendix_list.set_numbering_style(numbering_style)
         
         # Auto backup
-        self.backup_checkbox.setChecked(self.settings.auto_backup_enabled)
+        self._last_directory = self.settings.last_directory
+        self._auto_backup = self.settings.auto_backup_enabled
+        self.backup_checkbox.setChecked(self._auto_backup)
     
     def browse_pdf_files(self):
         """Open file browser to select PDF files."""
-        from PySide6.QtWidgets import QFileDialog
+        start_dir = self._last_directory
         
+        # Preselect the PDF filter and keep the default (native) dialog
         file_paths, _ = QFileDialog.getOpenFileNames(
             self,
             "Select PDF Files",
-            self.settings.last_directory if self.settings else "",
-            "PDF Files (*.pdf);;All Files (*)"
+            start_dir,
+            f"{PDF_FILE_FILTER};;All Files (*)",
+            PDF_FILE_FILTER,
+            QFileDialog.Options()
         )
         
         if file_paths:
             self.add_pdf_files(file_paths)
             
             # Update last directory
+            self._last_directory = str(Path(file_paths[0]).parent)
             if self.settings:
-                self.settings.last_directory = str(Path(file_paths[0]).parent)
+                self.settings.last_directory = self._last_directory
     
+    @Slot(list)
     def add_pdf_files(self, file_paths: list):
-        """Add PDF files as appendices."""
-        self.pdf_files_added.emit(file_paths)
-        self.logger.info(f"Added {len(file_paths)} PDF files")
+        """Add PDF files as appendices, emitting them in batches as they are checked."""
+        # Skip non-PDF paths and files that are already added or still in flight
+        seen = {self._pdf_path_key(a['path']) for a in self.appendix_data if 'path' in a}
+        seen.update(self._in_flight_pdf_keys)
+        
+        new_paths = []
+        for file_path in file_paths:
+            abs_path = os.path.abspath(file_path)
+            key = self._pdf_path_key(abs_path)
+            if key in seen or not key.lower().endswith('.pdf'):
+                continue
+            seen.add(key)
+            self._in_flight_pdf_keys.add(key)
+            new_paths.append(abs_path)
+        
+        if len(new_paths) < len(file_paths):
+            self.logger.info("Skipped %d duplicate or non-PDF files", len(file_paths) - len(new_paths))
+        if not new_paths:
+            return
+        
+        self._pending_pdf_paths.extend(new_paths)
+        if not self._pdf_filter_running:
+            self._pdf_batch_timer.start()
+        
+        self.logger.info("Queued %d PDF files", len(new_paths))
     
+    @staticmethod
+    def _pdf_path_key(file_path: str) -> str:
+        """Normalize a path for duplicate checks without touching the file system."""
+        return os.path.normcase(os.path.abspath(file_path))
+    
+    @Slot()
+    def _start_next_pdf_batch(self):
+        """Check the next batch of queued PDF paths in the thread pool."""
+        if self._pdf_filter_running or not self._pending_pdf_paths:
+            return
+        
+        batch_size = min(PDF_BATCH_SIZE, len(self._pending_pdf_paths))
+        batch = [self._pending_pdf_paths.popleft() for _ in range(batch_size)]
+        
+        self._pdf_filter_running = True
+        QThreadPool.globalInstance().start(PDFPathFilter(self._pdf_filter_signals, batch))
+    
+    @Slot(list, list)
+    def _on_pdf_paths_filtered(self, existing: list, missing: list):
+        """Emit a checked batch of PDF paths and queue the next one."""
+        self._pdf_filter_running = False
+        for file_path in missing:
+            self.logger.warning("Skipping missing PDF file: %s", file_path)
+            self._in_flight_pdf_keys.discard(self._pdf_path_key(file_path))
+        
+        # Re-arm before emitting so handlers see the remaining work in has_pending_pdf_files()
+        if self._pending_pdf_paths:
+            self._pdf_batch_timer.start()
+        
+        self.pdf_files_added.emit(existing)
+    
+    def release_pdf_files(self, file_paths: list):
+        """Stop treating emitted PDF paths as in flight, once the controller has processed them."""
+        for file_path in file_paths:
+            self._in_flight_pdf_keys.discard(self._pdf_path_key(file_path))
+    
+    def has_pending_pdf_files(self) -> bool:
+        """Check whether added PDF paths are still waiting to be emitted."""
+        return self._pdf_filter_running or bool(self._pending_pdf_paths)
+    
+    @Slot(dict)
     def on_document_selected(self, document_info):
         """Handle document selection."""
         self.current_document = document_info
@@ -425,20 +660,37 @@ class MainWindow(QMainWindow, LoggerMixin):
         # Enable controls
         self.enable_controls(True)
         
-        self.logger.info(f"Document selected: {doc_name}")
+        self.logger.info("Document selected: %s", doc_name)
     
+    @Slot(int)
     def on_appendix_selected(self, index: int):
         """Handle appendix selection."""
         if 0 <= index < len(self.appendix_data):
-            appendix = self.appendix_data[index]
-            
-            # Update preview
-            self.pdf_preview.load_pdf(appendix.get('path', ''))
-            
-            # Update details
-            self.update_appendix_details(appendix)
-            
-            # Enable/disable buttons
+            # Update preview and details once the selection settles
+            self._pending_preview_appendix = self.appendix_data[index]
+            self._preview_timer.start()
+        
+        self.update_list_buttons(index)
+    
+    @Slot()
+    def _do_load_preview(self):
+        """Load the preview and details for the most recently selected appendix."""
+        appendix = self._pending_preview_appendix
+        self._pending_preview_appendix = None
+        if appendix is None:
+            return
+        
+        self._ensure_preview().load_pdf(appendix.get('path', ''))
+        self.update_appendix_details(appendix)
+    
+    def _cancel_pending_preview(self):
+        """Drop a preview load that has not started yet."""
+        self._preview_timer.stop()
+        self._pending_preview_appendix = None
+    
+    def update_list_buttons(self, index: int):
+        """Enable or disable the list control buttons for the selected index."""
+        if 0 <= index < len(self.appendix_data):
             self.move_up_btn.setEnabled(index > 0)
             self.move_down_btn.setEnabled(index < len(self.appendix_data) - 1)
             self.remove_btn.setEnabled(True)
@@ -447,24 +699,81 @@ class MainWindow(QMainWindow, LoggerMixin):
             self.move_down_btn.setEnabled(False)
             self.remove_btn.setEnabled(False)
     
+    @Slot(int, int)
+    def on_appendix_reordered(self, from_index: int, to_index: int):
+        """Mirror a drag-and-drop reorder of the list in the appendix data."""
+        if 0 <= from_index < len(self.appendix_data) and 0 <= to_index < len(self.appendix_data):
+            appendix = self.appendix_data.pop(from_index)
+            self.appendix_data.insert(to_index, appendix)
+            self.update_list_buttons(self.appendix_list.get_selected_index())
+    
+    def _ensure_preview(self) -> PDFPreviewWidget:
+        """Create the PDF preview widget the first time it is needed."""
+        if self.pdf_preview is None:
+            self.pdf_preview = PDFPreviewWidget()
+            self._preview_stack.addWidget(self.pdf_preview)
+            self._preview_stack.setCurrentWidget(self.pdf_preview)
+        return self.pdf_preview
+    
+    def create_details_documents(self):
+        """Build the details panel documents once; selection updates only replace field text."""
+        self._details_placeholder_doc = QTextDocument(self)
+        self._details_placeholder_doc.setHtml("<i>Select an appendix to view details</i>")
+        
+        self._details_doc = QTextDocument(self)
+        self._details_doc.setHtml(
+            "<h3>%TITLE%</h3>"
+            "<p><b>File:</b> %FILE%</p>"
+            "<p><b>Pages:</b> %PAGES%</p>"
+            "<p><b>Size:</b> %SIZE%</p>"
+            "<p><b>Orientation:</b> %ORIENTATION%</p>"
+            "<p><b>Warnings:</b></p>"
+            "<p style='color: orange;'>%WARNINGS%</p>"
+        )
+        
+        # Remember the block, offset and character format of each placeholder
+        self._details_fields = {}
+        for field in ('TITLE', 'FILE', 'PAGES', 'SIZE', 'ORIENTATION', 'WARNINGS'):
+            cursor = self._details_doc.find(f"%{field}%")
+            block = cursor.block()
+            self._details_fields[field] = (block.blockNumber(), cursor.selectionStart() - block.position(),
+                                           cursor.charFormat())
+        self._details_warning_blocks = (self._details_fields['WARNINGS'][0] - 1,
+                                        self._details_fields['WARNINGS'][0])
+    
+    def show_details_placeholder(self):
+        """Show the details panel placeholder text."""
+        self.details_text.setDocument(self._details_placeholder_doc)
+    
+    def _set_details_field(self, field: str, text: str):
+        """Replace the text of one details field in place."""
+        block_number, offset, char_format = self._details_fields[field]
+        block = self._details_doc.findBlockByNumber(block_number)
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + offset)
+        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        cursor.insertText(text, char_format)
+    
     def update_appendix_details(self, appendix: Dict[str, Any]):
         """Update the details panel with appendix information."""
-        details_html = f"""
-        <h3>{appendix.get('title', 'Unknown Appendix')}</h3>
-        <p><b>File:</b> {Path(appendix.get('path', '')).name}</p>
-        <p><b>Pages:</b> {appendix.get('page_count', 0)}</p>
-        <p><b>Size:</b> {appendix.get('size_mb', 0):.1f} MB</p>
-        <p><b>Orientation:</b> {appendix.get('orientation', 'Unknown')}</p>
-        """
-        
-        if appendix.get('warnings'):
-            details_html += "<p><b>Warnings:</b></p><ul>"
-            for warning in appendix['warnings']:
-                details_html += f"<li style='color: orange;'>{warning}</li>"
-            details_html += "</ul>"
-        
-        self.details_text.setHtml(details_html)
+        self._set_details_field('TITLE', appendix.get('title', 'Unknown Appendix'))
+        self._set_details_field('FILE', Path(appendix.get('path', '')).name)
+        self._set_details_field('PAGES', str(appendix.get('page_count', 0)))
+        self._set_details_field('SIZE', f"{appendix.get('size_mb', 0):.1f} MB")
+        self._set_details_field('ORIENTATION', str(appendix.get('orientation', 'Unknown')))
+        
+        # Always rewrite the warnings, so a hidden block never keeps the previous
+        # appendix's warnings (or the template placeholder) for copy/select-all;
+        # line separators keep all warnings in the one pre-styled block
+        warnings = appendix.get('warnings')
+        self._set_details_field('WARNINGS', "\u2028".join(f"• {warning}" for warning in warnings or ()))
+        for block_number in self._details_warning_blocks:
+            self._details_doc.findBlockByNumber(block_number).setVisible(bool(warnings))
+        self._details_doc.markContentsDirty(0, self._details_doc.characterCount())
+        
+        self.details_text.setDocument(self._details_doc)
     
+    @Slot()
     def move_appendix_up(self):
         """Move selected appendix up in the list."""
         current_index = self.appendix_list.get_selected_index()
@@ -474,25 +783,29 @@ class MainWindow(QMainWindow, LoggerMixin):
                 self.appendix_data[current_index - 1], self.appendix_data[current_index]
             
             # Update UI
-            self.refresh_appendix_list()
+            self.appendix_list.move_appendix(current_index, current_index - 1)
             self.appendix_list.select_item(current_index - 1)
+            self.update_list_buttons(current_index - 1)
             
-            self.logger.info(f"Moved appendix from {current_index} to {current_index - 1}")
+            self.logger.info("Moved appendix from %d to %d", current_index, current_index - 1)
     
+    @Slot()
     def move_appendix_down(self):
         """Move selected appendix down in the list."""
         current_index = self.appendix_list.get_selected_index()
-        if current_index < len(self.appendix_data) - 1:
+        if 0 <= current_index < len(self.appendix_data) - 1:
             # Swap items in data
             self.appendix_data[current_index], self.appendix_data[current_index + 1] = \
                 self.appendix_data[current_index + 1], self.appendix_data[current_index]
             
             # Update UI
-            self.refresh_appendix_list()
+            self.appendix_list.move_appendix(current_index, current_index + 1)
             self.appendix_list.select_item(current_index + 1)
+            self.update_list_buttons(current_index + 1)
             
-            self.logger.info(f"Moved appendix from {current_index} to {current_index + 1}")
+            self.logger.info("Moved appendix from %d to %d", current_index, current_index + 1)
     
+    @Slot()
     def remove_appendix(self):
         """Remove selected appendix from the list."""
         current_index = self.appendix_list.get_selected_index()
@@ -513,35 +826,36 @@ class MainWindow(QMainWindow, LoggerMixin):
                 removed_appendix = self.appendix_data.pop(current_index)
                 
                 # Update UI
-                self.refresh_appendix_list()
-                self.update_appendix_count()
+                self.appendix_list.remove_appendix(current_index)
+                self._mark_ui_dirty()
                 
                 # Clear preview and details if this was the selected item
-                self.pdf_preview.clear()
-                self.details_text.setHtml("<i>Select an appendix to view details</i>")
+                self._cancel_pending_preview()
+                if self.pdf_preview:
+                    self.pdf_preview.clear()
+                self.show_details_placeholder()
+                self.update_list_buttons(-1)
                 
-                self.logger.info(f"Removed appendix: {appendix_name}")
+                self.logger.info("Removed appendix: %s", appendix_name)
                 self.appendix_removed.emit(current_index)
     
+    @Slot(int)
     def edit_appendix(self, index: int):
         """Edit appendix properties."""
         if 0 <= index < len(self.appendix_data):
-            from gui.dialogs import AppendixEditDialog
-            
             appendix = self.appendix_data[index]
-            dialog = AppendixEditDialog(appendix, self)
+            dialog = _lazy_dialog('AppendixEditDialog')(appendix, self)
             
             if dialog.exec() == dialog.Accepted:
                 updated_appendix = dialog.get_appendix_data()
                 self.appendix_data[index] = updated_appendix
-                self.refresh_appendix_list()
+                self.appendix_list.update_appendix(index, updated_appendix)
                 
-                self.logger.info(f"Edited appendix: {updated_appendix.get('title', 'Unknown')}")
+                self.logger.info("Edited appendix: %s", updated_appendix.get('title', 'Unknown'))
     
+    @Slot()
     def preview_changes(self):
         """Preview the changes that will be made to the document."""
-        from gui.dialogs import PreviewDialog
-        
         if not self.current_document or not self.appendix_data:
             QMessageBox.information(
                 self,
@@ -550,9 +864,10 @@ class MainWindow(QMainWindow, LoggerMixin):
             )
             return
         
-        dialog = PreviewDialog(self.current_document, self.appendix_data, self)
+        dialog = _lazy_dialog('PreviewDialog')(self.current_document, self.appendix_data, self)
         dialog.exec()
     
+    @Slot()
     def process_appendices(self):
         """Process the appendices and add them to the document."""
         if not self.current_document:
@@ -568,7 +883,7 @@ class MainWindow(QMainWindow, LoggerMixin):
             self,
             "Process Appendices",
             f"This will add {len(self.appendix_data)} appendices to the selected document.\n\n"
-            f"{'A backup will be created automatically.' if self.backup_checkbox.isChecked() else 'No backup will be created.'}\n\n"
+            f"{'A backup will be created automatically.' if self._auto_backup else 'No backup will be created.'}\n\n"
             "Do you want to continue?",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.Yes
@@ -577,21 +892,49 @@ class MainWindow(QMainWindow, LoggerMixin):
         if reply == QMessageBox.Yes:
             self.process_requested.emit()
     
-    def on_numbering_changed(self, text: str):
+    @Slot(int)
+    def on_numbering_changed(self, index: int):
         """Handle numbering style change."""
+        style = "numeric" if index == 1 else "alphabetical"
+        if style == self._numbering_style_cached:
+            return
+        
+        self._numbering_style_cached = style
         if self.settings:
-            style = "numeric" if "Numeric" in text else "alphabetical"
             self.settings.set('document.appendix_numbering_style', style)
-            self.refresh_appendix_list()
+        self.appendix_list.set_numbering_style(style)
     
+    @Slot(bool)
     def on_backup_setting_changed(self, enabled: bool):
         """Handle backup setting change."""
+        self._auto_backup = enabled
         if self.settings:
             self.settings.set('document.auto_backup', enabled)
     
     def refresh_appendix_list(self):
-        """Refresh the appendix list display."""
+        """Refresh the appendix list display.
+        
+        The list coalesces refreshes and keeps the selected appendix selected;
+        on_appendix_list_updated runs once the refresh is applied.
+        """
         self.appendix_list.update_appendices(self.appendix_data, self.get_numbering_style())
+    
+    @Slot()
+    def on_appendix_list_updated(self):
+        """Update buttons and counts after a coalesced list refresh."""
+        self.update_list_buttons(self.appendix_list.get_selected_index())
+        self._mark_ui_dirty()
+    
+    def _mark_ui_dirty(self):
+        """Schedule an update of the appendix count and process buttons."""
+        if not self._ui_dirty:
+            self._ui_dirty = True
+            self._ui_update_timer.start()
+    
+    @Slot()
+    def _flush_ui_updates(self):
+        """Apply the scheduled appendix count and process button updates."""
+        self._ui_dirty = False
         self.update_appendix_count()
         self.update_process_button()
     
@@ -668,12 +1011,10 @@ class MainWindow(QMainWindow, LoggerMixin):
     
     def open_project(self):
         """Open an existing project file."""
-        from PySide6.QtWidgets import QFileDialog
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Open Project",
-            self.settings.last_directory if self.settings else "",
+            self._last_directory,
             "Word Appendix Project (*.wap);;All Files (*)"
         )
         
@@ -682,12 +1023,10 @@ class MainWindow(QMainWindow, LoggerMixin):
     
     def save_project(self):
         """Save the current project."""
-        from PySide6.QtWidgets import QFileDialog
-        
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Project",
-            self.settings.last_directory if self.settings else "",
+            self._last_directory,
             "Word Appendix Project (*.wap);;All Files (*)"
         )
         
@@ -696,9 +1035,7 @@ class MainWindow(QMainWindow, LoggerMixin):
     
     def show_settings(self):
         """Show the settings dialog."""
-        from gui.dialogs.settings_dialog import SettingsDialog
-        
-        dialog = SettingsDialog(self.settings, self.theme_manager, self)
+        dialog = _lazy_dialog('SettingsDialog')(self.settings, self.theme_manager, self)
         if dialog.exec() == QDialog.Accepted:
             self.apply_settings()
             self.logger.info("Settings updated")
@@ -726,59 +1063,66 @@ class MainWindow(QMainWindow, LoggerMixin):
         # Reset UI
         self.document_selector.clear_selection()
         self.appendix_list.update_appendices([], self.get_numbering_style())
-        self.pdf_preview.clear()
-        self.details_text.setHtml("<i>Select an appendix to view details</i>")
+        self._cancel_pending_preview()
+        if self.pdf_preview:
+            self.pdf_preview.clear()
+        self.show_details_placeholder()
         self.doc_info_label.setText("No document selected")
         self.doc_status_label.setText("No document")
         
         # Disable controls
         self.enable_controls(False)
-        self.update_appendix_count()
+        self._mark_ui_dirty()
         
         self.logger.info("Project cleared")
     
     def load_project(self, file_path: str):
-        """Load project from file."""
-        try:
-            import json
-            with open(file_path, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
-            
-            # Load project data
-            self.current_document = project_data.get('document')
-            self.appendix_data = project_data.get('appendices', [])
-            
-            # Update UI
-            self.refresh_appendix_list()
-            
-            self.logger.info(f"Project loaded: {file_path}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to load project: {e}")
-            QMessageBox.critical(self, "Load Error", f"Failed to load project:\n{str(e)}")
+        """Load project from file in the background."""
+        QThreadPool.globalInstance().start(ProjectLoadTask(self._project_signals, file_path))
+    
+    @Slot(str, object)
+    def on_project_loaded(self, file_path: str, project_data: Dict[str, Any]):
+        """Apply a project read by ProjectLoadTask."""
+        # Load project data
+        self.current_document = project_data.get('document')
+        self.appendix_data = project_data.get('appendices', [])
+        
+        # Update UI
+        self.refresh_appendix_list()
+        
+        self.logger.info("Project loaded: %s", file_path)
     
     def save_project_to_file(self, file_path: str):
-        """Save project to file."""
+        """Save project to file in the background."""
         try:
-            import json
             project_data = {
                 'version': '1.0',
                 'document': self.current_document,
                 'appendices': self.appendix_data,
                 'settings': {
                     'numbering_style': self.get_numbering_style(),
-                    'auto_backup': self.backup_checkbox.isChecked()
+                    'auto_backup': self._auto_backup
                 }
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=2, ensure_ascii=False)
-            
-            self.logger.info(f"Project saved: {file_path}")
+            # Serialize now so later edits cannot race with the write
+            data = dump_project_json(project_data)
+            QThreadPool.globalInstance().start(ProjectSaveTask(self._project_signals, file_path, data))
             
         except Exception as e:
-            self.logger.error(f"Failed to save project: {e}")
-            QMessageBox.critical(self, "Save Error", f"Failed to save project:\n{str(e)}")
+            self.on_project_failed("save", file_path, str(e))
+    
+    @Slot(str)
+    def on_project_saved(self, file_path: str):
+        """Handle a project written by ProjectSaveTask."""
+        self.logger.info("Project saved: %s", file_path)
+    
+    @Slot(str, str, str)
+    def on_project_failed(self, operation: str, file_path: str, error_message: str):
+        """Report a failed project load or save."""
+        self.logger.error("Failed to %s project: %s", operation, error_message)
+        QMessageBox.critical(self, f"{operation.title()} Error",
+                             f"Failed to {operation} project:\n{error_message}")
     
     def closeEvent(self, event):
         """Handle window close event."""
@@ -791,6 +1135,9 @@ class MainWindow(QMainWindow, LoggerMixin):
             )
             self.settings.save_settings()
         
+        # Release the document selector's Word connection
+        self.document_selector.close()
+        
         self.logger.info("Main window closing")
         event.accept()
     
@@ -800,9 +1147,17 @@ class MainWindow(QMainWindow, LoggerMixin):
         self.appendix_data = appendices
         self.refresh_appendix_list()
     
-    def get_appendix_data(self) -> list:
-        """Get the current appendix data."""
-        return self.appendix_data.copy()
+    def get_appendix_data(self) -> Tuple[Dict[str, Any], ...]:
+        """Get the current appendix data as a read-only sequence.
+        
+        The appendix dicts are shared, not copied; change appendices through
+        add_appendix() or set_appendix_data(), or use snapshot() for a deep copy.
+        """
+        return tuple(self.appendix_data)
+    
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Get a deep copy of the appendix data that is safe to modify."""
+        return copy.deepcopy(self.appendix_data)
     
     def get_current_document(self) -> Optional[Dict]:
         """Get the current document information."""
@@ -811,4 +1166,5 @@ class MainWindow(QMainWindow, LoggerMixin):
     def add_appendix(self, appendix_data: Dict[str, Any]):
         """Add a single appendix to the list."""
         self.appendix_data.append(appendix_data)
-        self.refresh_appendix_list()
\ No newline at end of file
+        self.appendix_list.insert_appendix(len(self.appendix_data) - 1, appendix_data)
+        self._mark_ui_dirty()
\ No newline at end of file
@@ -3,290 +3,581 @@ Appendix List Widget
 Custom widget for displaying and managing the list of appendices.
 """
 
-import sys
-from pathlib import Path
+import os
+from difflib import SequenceMatcher
+from functools import lru_cache
 
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
-from PySide6.QtWidgets import (
-    QListWidget, QListWidgetItem, QWidget, QVBoxLayout, 
-    QHBoxLayout, QLabel, QFrame
-)
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QFont
-from typing import List, Dict, Any, Optional
+from PySide6.QtWidgets import QListView, QAbstractItemView, QStyledItemDelegate, QStyle, QApplication
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QRect, QTimer, QAbstractListModel, QModelIndex, QSignalBlocker
+from PySide6.QtGui import QColor, QPainter, QPalette, QFont, QFontMetrics
+from typing import List, Dict, Any, Optional, Tuple
 
 from utils.logger import get_logger, LoggerMixin
 
+# Status dot colors by appendix status, and their QColor versions shared by every row
+STATUS_COLORS = {
+    'warning': "#ff9800",  # Orange for warnings
+    'valid': "#4caf50",    # Green for valid
+    'error': "#f44336",    # Red for errors
+}
+_STATUS_QCOLORS = {status: QColor(color) for status, color in STATUS_COLORS.items()}
+
+
+@lru_cache(maxsize=None)
+def _alpha_label(index: int) -> str:
+    """Get the alphabetical label for an appendix index (A-Z, then AA, AB...)."""
+    if index < 26:
+        return f"Appendix {chr(ord('A') + index)}"
+    # For more than 26 appendices, use AA, AB, AC...
+    first_letter = chr(ord('A') + (index // 26) - 1)
+    second_letter = chr(ord('A') + (index % 26))
+    return f"Appendix {first_letter}{second_letter}"
+
 
-class AppendixItemWidget(QWidget):
-    """Custom widget for displaying appendix information in the list."""
+@lru_cache(maxsize=None)
+def _numeric_label(index: int) -> str:
+    """Get the numeric label for an appendix index."""
+    return f"{index + 1}."
+
+
+@lru_cache(maxsize=1024)
+def _row_text(path: str, page_count: int, size_mb: float, orientation: str, warning_count: int) -> Tuple[str, str]:
+    """Get the numbering-independent (filename, details) text of an appendix row."""
+    details = [
+        f"{page_count} page{'s' if page_count != 1 else ''}",
+        f"{size_mb:.1f} MB",
+        orientation.title()
+    ]
+    if warning_count:
+        details.append(f"⚠ {warning_count} warning(s)")
     
-    def __init__(self, appendix_data: Dict[str, Any], numbering: str, parent=None):
+    return os.path.basename(path), ' • '.join(details)
+
+
+class AppendixListModel(QAbstractListModel):
+    """List model exposing appendix dictionaries to the appendix list view."""
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.appendix_data = appendix_data
-        self.numbering = numbering
-        self.setup_ui()
+        self.appendices: List[Dict[str, Any]] = []
+        self.numbering_style = "alphabetical"
+        self._label_cache: List[Optional[str]] = []  # Rendered display text per row, None when stale
+        
+        # Running totals, kept in step with every row change
+        self.total_pages = 0
+        self.total_size_mb = 0.0
     
-    def setup_ui(self):
-        """Set up the item widget UI."""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 4, 8, 4)
-        layout.setSpacing(8)
-        
-        # Status indicator (colored dot)
-        status_frame = QFrame()
-        status_frame.setFixedSize(12, 12)
-        status_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self.get_status_color()};
-                border-radius: 6px;
-                border: 1px solid #ccc;
-            }}
-        """)
-        layout.addWidget(status_frame)
-        
-        # Main content
-        content_layout = QVBoxLayout()
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(2)
-        
-        # Title line
-        title_layout = QHBoxLayout()
-        title_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Appendix number/letter
-        number_label = QLabel(f"{self.numbering}")
-        number_font = QFont()
-        number_font.setBold(True)
-        number_font.setPointSize(10)
-        number_label.setFont(number_font)
-        number_label.setStyleSheet("color: #2c5aa0; font-weight: bold;")
-        number_label.setMinimumWidth(30)
-        title_layout.addWidget(number_label)
-        
-        # File name
-        filename = Path(self.appendix_data.get('path', '')).name
-        name_label = QLabel(filename)
-        name_font = QFont()
-        name_font.setPointSize(9)
-        name_label.setFont(name_font)
-        name_label.setToolTip(self.appendix_data.get('path', ''))
-        title_layout.addWidget(name_label, 1)
-        
-        # Page count badge
-        page_count = self.appendix_data.get('page_count', 0)
-        pages_label = QLabel(f"{page_count} page{'s' if page_count != 1 else ''}")
-        pages_label.setStyleSheet("""
-            QLabel {
-                background-color: #e3f2fd;
-                border: 1px solid #bbdefb;
-                border-radius: 10px;
-                padding: 2px 8px;
-                font-size: 8pt;
-                color: #1976d2;
-            }
-        """)
-        title_layout.addWidget(pages_label)
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Get the number of appendices in the model."""
+        return 0 if parent.isValid() else len(self.appendices)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Get the data for an appendix row, computed on demand."""
+        if not index.isValid() or not 0 <= index.row() < len(self.appendices):
+            return None
+        
+        appendix = self.appendices[index.row()]
+        
+        if role == Qt.DisplayRole:
+            label = self._label_cache[index.row()]
+            if label is None:
+                label = self._label_cache[index.row()] = self.get_display_text(index.row(), appendix)
+            return label
+        if role == Qt.DecorationRole:
+            return _STATUS_QCOLORS[self.get_status(appendix)]
+        if role == Qt.ToolTipRole:
+            tooltip = appendix.get('path', '')
+            if appendix.get('warnings'):
+                tooltip += "\n" + "\n".join(appendix['warnings'])
+            return tooltip
+        if role == Qt.UserRole:
+            return appendix
+        
+        return None
+    
+    def flags(self, index: QModelIndex):
+        """Get the item flags; rows can be dragged and dropped between rows."""
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+    
+    def supportedDropActions(self):
+        """Only internal moves are supported."""
+        return Qt.MoveAction
+    
+    def moveRows(self, source_parent: QModelIndex, source_row: int, count: int,
+                 destination_parent: QModelIndex, destination_child: int) -> bool:
+        """Move rows within the list (used by internal drag and drop)."""
+        if source_parent.isValid() or destination_parent.isValid():
+            return False
+        if source_row <= destination_child <= source_row + count:
+            return False  # Dropped onto itself
         
-        content_layout.addLayout(title_layout)
+        if not self.beginMoveRows(QModelIndex(), source_row, source_row + count - 1,
+                                  QModelIndex(), destination_child):
+            return False
         
-        # Details line
-        details_layout = QHBoxLayout()
-        details_layout.setContentsMargins(30, 0, 0, 0)  # Indent to align with filename
+        moved = self.appendices[source_row:source_row + count]
+        del self.appendices[source_row:source_row + count]
+        insert_at = destination_child if destination_child < source_row else destination_child - count
+        self.appendices[insert_at:insert_at] = moved
         
-        # Size info
-        size_mb = self.appendix_data.get('size_mb', 0)
-        size_label = QLabel(f"{size_mb:.1f} MB")
-        size_label.setStyleSheet("color: #666; font-size: 8pt;")
-        details_layout.addWidget(size_label)
+        self.endMoveRows()
         
-        # Orientation
-        orientation = self.appendix_data.get('orientation', 'Unknown')
-        orientation_label = QLabel(f"• {orientation.title()}")
-        orientation_label.setStyleSheet("color: #666; font-size: 8pt;")
-        details_layout.addWidget(orientation_label)
+        # Numbering depends on position, so every row between the two ends changes
+        first = min(source_row, insert_at)
+        last = max(source_row, insert_at) + count - 1
+        self._label_cache[first:last + 1] = [None] * (last - first + 1)
+        self.dataChanged.emit(self.index(first), self.index(last), [Qt.DisplayRole])
+        return True
+    
+    def insert_appendix(self, row: int, appendix: Dict[str, Any]):
+        """Insert a single appendix at the given row."""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.appendices.insert(row, appendix)
+        self._add_to_totals(appendix, 1)
+        self._label_cache.insert(row, None)
+        self.endInsertRows()
+        self._renumber_from(row + 1)
+    
+    def remove_appendix(self, row: int):
+        """Remove the appendix at the given row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._add_to_totals(self.appendices[row], -1)
+        del self.appendices[row]
+        del self._label_cache[row]
+        self.endRemoveRows()
+        self._renumber_from(row)
+    
+    def update_appendix(self, row: int, appendix: Dict[str, Any]):
+        """Replace the appendix at the given row."""
+        self._add_to_totals(self.appendices[row], -1)
+        self._add_to_totals(appendix, 1)
+        self.appendices[row] = appendix
+        self._label_cache[row] = None
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+    
+    def move_appendix(self, from_row: int, to_row: int) -> bool:
+        """Move a single appendix so that it ends up at to_row."""
+        destination = to_row + 1 if to_row > from_row else to_row
+        return self.moveRows(QModelIndex(), from_row, 1, QModelIndex(), destination)
+    
+    def _renumber_from(self, row: int):
+        """Repaint rows from the given row on, whose numbering has shifted."""
+        if row < len(self.appendices):
+            self._label_cache[row:] = [None] * (len(self.appendices) - row)
+            self.dataChanged.emit(self.index(row), self.index(len(self.appendices) - 1), [Qt.DisplayRole])
+    
+    def set_appendices(self, appendices: List[Dict[str, Any]], numbering_style: str):
+        """Update the model contents, inserting and removing only the rows that differ.
         
-        # Warnings indicator
-        if self.appendix_data.get('warnings'):
-            warning_label = QLabel(f"• ⚠ {len(self.appendix_data['warnings'])} warning(s)")
-            warning_label.setStyleSheet("color: #f57c00; font-size: 8pt;")
-            warning_label.setToolTip("\n".join(self.appendix_data['warnings']))
-            details_layout.addWidget(warning_label)
+        The model may keep the given list itself, so callers must pass a list
+        they no longer modify.
+        """
+        if not self.appendices or not appendices:
+            self.beginResetModel()
+            self.appendices = appendices
+            self.numbering_style = numbering_style
+            self._label_cache = [None] * len(self.appendices)
+            self._recompute_totals()
+            self.endResetModel()
+            return
         
-        details_layout.addStretch()
-        content_layout.addLayout(details_layout)
+        # Diff by identity; both lists hold references, so ids are unique while comparing
+        old_ids = [id(appendix) for appendix in self.appendices]
+        new_ids = [id(appendix) for appendix in appendices]
+        opcodes = SequenceMatcher(None, old_ids, new_ids, autojunk=False).get_opcodes()
         
-        layout.addLayout(content_layout, 1)
+        first_changed = len(appendices)
+        for tag, i1, i2, j1, j2 in reversed(opcodes):  # From the end so earlier rows keep their numbers
+            if tag == 'equal':
+                continue
+            first_changed = i1
+            if tag in ('delete', 'replace'):
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self.appendices[i1:i2]
+                del self._label_cache[i1:i2]
+                self.endRemoveRows()
+            if tag in ('insert', 'replace'):
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                self.appendices[i1:i1] = appendices[j1:j2]
+                self._label_cache[i1:i1] = [None] * (j2 - j1)
+                self.endInsertRows()
+        
+        # Rows after the first change may have been renumbered; a new style re-renders every row
+        if numbering_style != self.numbering_style:
+            self.numbering_style = numbering_style
+            first_changed = 0
+        self._renumber_from(first_changed)
+        self._recompute_totals()
+    
+    def _add_to_totals(self, appendix: Dict[str, Any], sign: int):
+        """Add (sign 1) or subtract (sign -1) an appendix from the running totals."""
+        self.total_pages += sign * appendix.get('page_count', 0)
+        self.total_size_mb += sign * appendix.get('size_mb', 0)
+    
+    def _recompute_totals(self):
+        """Recompute the running totals after a bulk update."""
+        appendices = self.appendices
+        self.total_pages = sum(appendix.get('page_count', 0) for appendix in appendices)
+        self.total_size_mb = sum(appendix.get('size_mb', 0) for appendix in appendices)
     
-    def get_status_color(self) -> str:
+    def set_numbering_style(self, numbering_style: str):
+        """Change the numbering style, re-rendering labels only if it differs."""
+        if numbering_style == self.numbering_style:
+            return
+        
+        self.numbering_style = numbering_style
+        self._renumber_from(0)
+    
+    def get_numbering(self, index: int) -> str:
+        """Get the numbering string for an appendix at the given index."""
+        if self.numbering_style == "numeric":
+            return _numeric_label(index)
+        return _alpha_label(index)
+    
+    def get_display_text(self, index: int, appendix: Dict[str, Any]) -> str:
+        """Get the two-line display text for an appendix.
+        
+        The filename and details are memoized, so renumbering a row only
+        rebuilds its numbering prefix.
+        """
+        filename, details = _row_text(
+            appendix.get('path', ''),
+            appendix.get('page_count', 0),
+            appendix.get('size_mb', 0),
+            appendix.get('orientation', 'Unknown'),
+            len(appendix.get('warnings') or ())
+        )
+        return f"{self.get_numbering(index)}  {filename}\n{details}"
+    
+    @staticmethod
+    def get_status(appendix: Dict[str, Any]) -> str:
+        """Get the status key ('warning', 'valid' or 'error') for the appendix."""
+        if appendix.get('warnings'):
+            return 'warning'
+        return 'valid' if appendix.get('valid', True) else 'error'
+    
+    @staticmethod
+    def get_status_color(appendix: Dict[str, Any]) -> str:
         """Get the status color for the appendix."""
-        if self.appendix_data.get('warnings'):
-            return "#ff9800"  # Orange for warnings
-        elif self.appendix_data.get('valid', True):
-            return "#4caf50"  # Green for valid
+        return STATUS_COLORS[AppendixListModel.get_status(appendix)]
+
+
+class AppendixItemDelegate(QStyledItemDelegate):
+    """Paints appendix rows directly with QPainter instead of through per-row widgets."""
+    
+    ROW_HEIGHT = 60
+    STATUS_DOT_SIZE = 12
+    SELECTED_TEXT_COLOR = QColor("#212529")
+    DETAIL_TEXT_ALPHA = 150
+    
+    # Detail line colors keyed by the RGBA of the row text color
+    _detail_colors = {}
+    
+    # Fonts derived from the view font, shared by all delegate instances
+    _base_font = None
+    _title_font = None
+    _title_metrics = None
+    _detail_font = None
+    
+    @classmethod
+    def _update_fonts(cls, base_font: QFont):
+        """Build the row fonts once per view font."""
+        if cls._base_font == base_font:
+            return
+        
+        cls._base_font = QFont(base_font)
+        cls._title_font = QFont(base_font)
+        cls._title_font.setBold(True)
+        cls._title_metrics = QFontMetrics(cls._title_font)
+        cls._detail_font = QFont(base_font)
+        cls._detail_font.setPointSizeF(max(1.0, base_font.pointSizeF() - 1))
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        """Paint the status dot, title line and detail line of an appendix row."""
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        
+        # Background, selection and hover come from the style sheet
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, widget)
+        
+        self._update_fonts(option.font)
+        title, _, details = (index.data(Qt.DisplayRole) or "").partition("\n")
+        
+        if option.state & QStyle.State_Selected:
+            text_color = self.SELECTED_TEXT_COLOR
         else:
-            return "#f44336"  # Red for errors
+            text_color = option.palette.color(QPalette.Text)
+        detail_color = self._detail_colors.get(text_color.rgba())
+        if detail_color is None:
+            detail_color = QColor(text_color)
+            detail_color.setAlpha(self.DETAIL_TEXT_ALPHA)
+            self._detail_colors[text_color.rgba()] = detail_color
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        rect = option.rect.adjusted(10, 6, -10, -6)
+        
+        # Status dot
+        dot_size = self.STATUS_DOT_SIZE
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(index.data(Qt.DecorationRole) or _STATUS_QCOLORS['valid'])
+        painter.drawEllipse(QRect(rect.left(), rect.center().y() - dot_size // 2, dot_size, dot_size))
+        
+        # Numbering and filename on the first line, details on the second
+        text_rect = rect.adjusted(dot_size + 10, 0, 0, 0)
+        half_height = text_rect.height() // 2
+        
+        painter.setPen(text_color)
+        painter.setFont(self._title_font)
+        painter.drawText(text_rect.adjusted(0, 0, 0, -half_height), Qt.AlignLeft | Qt.AlignBottom,
+                         self._title_metrics.elidedText(title, Qt.ElideMiddle, text_rect.width()))
+        
+        painter.setPen(detail_color)
+        painter.setFont(self._detail_font)
+        painter.drawText(text_rect.adjusted(0, half_height + 2, 0, 0), Qt.AlignLeft | Qt.AlignTop, details)
+        
+        painter.restore()
+    
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        """All rows have the same height."""
+        return QSize(0, self.ROW_HEIGHT)
 
 
-class AppendixListWidget(QListWidget, LoggerMixin):
-    """Custom list widget for displaying appendices."""
+class AppendixListWidget(QListView, LoggerMixin):
+    """Custom list view for displaying appendices."""
     
     # Signals
     selection_changed = Signal(int)  # Index of selected item
     item_double_clicked = Signal(int)  # Index of double-clicked item
     items_reordered = Signal(int, int)  # From index, to index
+    appendices_updated = Signal()  # A coalesced update_appendices call was applied
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.appendix_data = []
-        self.numbering_style = "alphabetical"
+        self._model = AppendixListModel(self)
+        self.setModel(self._model)
+        self.setItemDelegate(AppendixItemDelegate(self))
+        self._drop_in_progress = False  # True while a drag-and-drop move is applied
+        
+        # update_appendices calls are coalesced and applied once per event loop turn
+        self._pending_update = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._apply_update)
         
         self.setup_ui()
         self.setup_connections()
     
+    @property
+    def appendix_data(self) -> List[Dict[str, Any]]:
+        """The appendices currently shown in the list."""
+        self.flush_pending_update()
+        return self._model.appendices
+    
+    @property
+    def numbering_style(self) -> str:
+        """The numbering style currently used for the list."""
+        self.flush_pending_update()
+        return self._model.numbering_style
+    
     def setup_ui(self):
-        """Set up the list widget UI."""
+        """Set up the list view UI."""
         self.setAlternatingRowColors(True)
-        self.setSelectionMode(QListWidget.SingleSelection)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
         self.setDefaultDropAction(Qt.MoveAction)
-        self.setDragDropMode(QListWidget.InternalMove)
+        self.setDragDropMode(QAbstractItemView.InternalMove)
+        self.setUniformItemSizes(True)
+        
+        # Lay out long lists in chunks so the first paint does not wait for every row
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(64)
+        self.setResizeMode(QListView.Adjust)
         
         # Styling
         self.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 1px solid #d0d0d0;
                 border-radius: 4px;
                 background-color: white;
                 outline: none;
             }
-            QListWidget::item {
+            QListView::item {
                 border-bottom: 1px solid #f0f0f0;
                 padding: 0px;
                 margin: 0px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #e3f2fd;
                 border-left: 3px solid #2196f3;
+                color: #212529;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #f5f5f5;
             }
         """)
         
         # Set minimum item height
         self.setMinimumHeight(200)
-        
-        # Empty state
-        self.show_empty_state()
     
     def setup_connections(self):
         """Set up signal-slot connections."""
-        self.itemSelectionChanged.connect(self.on_selection_changed)
-        self.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.doubleClicked.connect(self.on_item_double_clicked)
+        self._model.rowsMoved.connect(self.on_rows_moved)
     
     def update_appendices(self, appendices: List[Dict[str, Any]], numbering_style: str = "alphabetical"):
-        """Update the list with new appendix data."""
-        self.appendix_data = appendices.copy()
-        self.numbering_style = numbering_style
-        
-        # Clear existing items
-        self.clear()
+        """Update the list with new appendix data.
         
-        if not appendices:
-            self.show_empty_state()
+        The update is applied on the next event loop turn, so a burst of calls
+        only updates the list once; appendices_updated is emitted afterwards.
+        Every other method applies a pending update first.
+        """
+        # Copy the list so later changes by the caller are not applied twice;
+        # the model takes this copy over as is
+        self._pending_update = (list(appendices), numbering_style)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+    
+    def flush_pending_update(self):
+        """Apply a pending update_appendices call right away."""
+        if self._pending_update is not None:
+            self._update_timer.stop()
+            self._apply_update()
+    
+    @Slot()
+    def _apply_update(self):
+        """Apply the latest update_appendices call, keeping the selected appendix selected."""
+        if self._pending_update is None:
             return
+        appendices, numbering_style = self._pending_update
+        self._pending_update = None
+        
+        prev_index = self.get_selected_index()
+        prev_appendix = self._model.appendices[prev_index] if prev_index >= 0 else None
+        
+        # Update silently and repaint once at the end; only a change of the
+        # selected appendix is reported
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self):
+                self._model.set_appendices(appendices, numbering_style)
+                if self.get_selected_index() < 0:
+                    self.select_item(prev_index)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        index = self.get_selected_index()
+        if index >= 0 and self._model.appendices[index] is not prev_appendix:
+            self.selection_changed.emit(index)
         
-        # Add appendix items
-        for i, appendix in enumerate(appendices):
-            numbering = self.get_numbering(i)
-            
-            # Create list item
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 60))  # Set item height
-            
-            # Create custom widget
-            item_widget = AppendixItemWidget(appendix, numbering, self)
-            
-            # Add to list
-            self.addItem(item)
-            self.setItemWidget(item, item_widget)
-        
-        self.logger.info(f"Updated appendix list: {len(appendices)} items")
+        self.logger.info("Updated appendix list: %d items", len(appendices))
+        self.appendices_updated.emit()
+    
+    def insert_appendix(self, index: int, appendix: Dict[str, Any]):
+        """Insert a single appendix without rebuilding the list."""
+        self.flush_pending_update()
+        self._model.insert_appendix(index, appendix)
+    
+    def remove_appendix(self, index: int):
+        """Remove a single appendix without rebuilding the list."""
+        self.flush_pending_update()
+        if 0 <= index < self._model.rowCount():
+            self._model.remove_appendix(index)
+    
+    def update_appendix(self, index: int, appendix: Dict[str, Any]):
+        """Replace a single appendix without rebuilding the list."""
+        self.flush_pending_update()
+        if 0 <= index < self._model.rowCount():
+            self._model.update_appendix(index, appendix)
+    
+    def move_appendix(self, from_index: int, to_index: int):
+        """Move a single appendix without rebuilding the list."""
+        self.flush_pending_update()
+        count = self._model.rowCount()
+        if 0 <= from_index < count and 0 <= to_index < count:
+            self._model.move_appendix(from_index, to_index)
+    
+    def set_numbering_style(self, numbering_style: str):
+        """Change the numbering style without rebuilding the list."""
+        self.flush_pending_update()
+        self._model.set_numbering_style(numbering_style)
     
     def get_numbering(self, index: int) -> str:
         """Get the numbering string for an appendix at the given index."""
-        if self.numbering_style == "numeric":
-            return f"{index + 1}."
-        else:  # alphabetical
-            if index < 26:
-                return f"Appendix {chr(ord('A') + index)}"
-            else:
-                # For more than 26 appendices, use AA, AB, AC...
-                first_letter = chr(ord('A') + (index // 26) - 1)
-                second_letter = chr(ord('A') + (index % 26))
-                return f"Appendix {first_letter}{second_letter}"
-    
-    def show_empty_state(self):
-        """Show empty state message."""
-        item = QListWidgetItem()
-        item.setSizeHint(QSize(0, 80))
-        
-        empty_widget = QWidget()
-        layout = QVBoxLayout(empty_widget)
-        layout.setAlignment(Qt.AlignCenter)
-        
-        # Empty state icon/text
-        empty_label = QLabel("📄 No appendices added yet")
-        empty_label.setAlignment(Qt.AlignCenter)
-        empty_label.setStyleSheet("""
-            QLabel {
-                color: #999;
-                font-size: 14pt;
-                font-style: italic;
-                padding: 20px;
-            }
-        """)
-        layout.addWidget(empty_label)
-        
-        hint_label = QLabel("Drag & drop PDF files here or use the Browse button")
-        hint_label.setAlignment(Qt.AlignCenter)
-        hint_label.setStyleSheet("""
-            QLabel {
-                color: #bbb;
-                font-size: 10pt;
-                font-style: italic;
-            }
-        """)
-        layout.addWidget(hint_label)
+        self.flush_pending_update()
+        return self._model.get_numbering(index)
+    
+    def paintEvent(self, event):
+        """Paint the list, or the empty state message when there are no appendices."""
+        if self._model.rowCount() > 0:
+            super().paintEvent(event)
+            return
         
-        self.addItem(item)
-        self.setItemWidget(item, empty_widget)
+        painter = QPainter(self.viewport())
+        rect = self.viewport().rect()
         
-        # Make the empty state item non-selectable
-        item.setFlags(item.flags() & ~Qt.ItemIsSelectable)
+        font = painter.font()
+        font.setItalic(True)
+        font.setPointSize(14)
+        painter.setFont(font)
+        painter.setPen(QColor("#999"))
+        painter.drawText(rect.adjusted(10, 0, -10, -rect.height() // 2),
+                         Qt.AlignHCenter | Qt.AlignBottom | Qt.TextWordWrap,
+                         "📄 No appendices added yet")
+        
+        font.setPointSize(10)
+        painter.setFont(font)
+        painter.setPen(QColor("#bbb"))
+        painter.drawText(rect.adjusted(10, rect.height() // 2 + 10, -10, 0),
+                         Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap,
+                         "Drag & drop PDF files here or use the Browse button")
+        painter.end()
+    
+    def dropEvent(self, event):
+        """Handle drop events for reordering."""
+        self._drop_in_progress = True
+        try:
+            super().dropEvent(event)
+        finally:
+            self._drop_in_progress = False
     
-    def on_selection_changed(self):
+    def on_selection_changed(self, selected, deselected):
         """Handle selection change."""
-        current_row = self.currentRow()
+        current_row = self.get_selected_index()
         if current_row >= 0 and current_row < len(self.appendix_data):
             self.selection_changed.emit(current_row)
     
-    def on_item_double_clicked(self, item: QListWidgetItem):
+    def on_item_double_clicked(self, index: QModelIndex):
         """Handle item double click."""
-        row = self.row(item)
+        row = index.row()
         if row >= 0 and row < len(self.appendix_data):
             self.item_double_clicked.emit(row)
     
+    def on_rows_moved(self, parent, start: int, end: int, destination, row: int):
+        """Handle rows reordered by drag and drop."""
+        if not self._drop_in_progress:
+            return  # Programmatic move; the caller already knows about it
+        
+        dest_index = row if row < start else row - 1
+        self.items_reordered.emit(start, dest_index)
+        self.logger.info("Reordered appendix from %d to %d", start, dest_index)
+    
     def get_selected_index(self) -> int:
         """Get the index of the currently selected item."""
-        return self.currentRow()
+        self.flush_pending_update()
+        rows = self.selectionModel().selectedRows()
+        return rows[0].row() if rows else -1
     
     def select_item(self, index: int):
         """Select an item by index."""
-        if 0 <= index < self.count() and index < len(self.appendix_data):
-            self.setCurrentRow(index)
+        self.flush_pending_update()
+        if 0 <= index < self._model.rowCount():
+            self.setCurrentIndex(self._model.index(index))
     
     def get_appendix_count(self) -> int:
         """Get the number of appendices."""
@@ -298,35 +589,10 @@ class AppendixListWidget(QListWidget, LoggerMixin):
     
     def get_total_pages(self) -> int:
         """Get the total number of pages across all appendices."""
-        return sum(appendix.get('page_count', 0) for appendix in self.appendix_data)
+        self.flush_pending_update()
+        return self._model.total_pages
     
     def get_total_size_mb(self) -> float:
         """Get the total size in MB across all appendices."""
-        return sum(appendix.get('size_mb', 0) for appendix in self.appendix_data)
-    
-    def dropEvent(self, event):
-        """Handle drop events for reordering."""
-        # Get source and destination indices
-        source_index = self.currentRow()
-        
-        # Call parent implementation to handle the drop
-        super().dropEvent(event)
-        
-        # Get new index after drop
-        dest_index = self.currentRow()
-        
-        if source_index != dest_index and source_index >= 0 and dest_index >= 0:
-            # Move item in our data structure
-            if 0 <= source_index < len(self.appendix_data) and 0 <= dest_index < len(self.appendix_data):
-                # Move the data
-                item = self.appendix_data.pop(source_index)
-                self.appendix_data.insert(dest_index, item)
-                
-                # Refresh the display
-                self.update_appendices(self.appendix_data, self.numbering_style)
-                self.select_item(dest_index)
-                
-                # Emit reorder signal
-                self.items_reordered.emit(source_index, dest_index)
-                
-                self.logger.info(f"Reordered appendix from {source_index} to {dest_index}") 
+        self.flush_pending_update()
+        return self._model.total_size_mb
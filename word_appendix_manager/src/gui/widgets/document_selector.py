@@ -3,21 +3,61 @@ Document Selector Widget
 Provides interface for selecting Word documents (open documents or files).
 """
 
-import sys
+import threading
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QComboBox, 
     QPushButton, QLabel, QButtonGroup, QRadioButton, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker
 from typing import Dict, List, Any, Optional
 
 from utils.logger import get_logger, LoggerMixin
 
+# COM must be initialized once in each thread that talks to Word
+_com_thread_state = threading.local()
+
+
+def _ensure_com_initialized():
+    """Initialize COM for the current thread if pywin32 is available."""
+    if getattr(_com_thread_state, 'initialized', False):
+        return
+    
+    try:
+        import pythoncom
+    except ImportError:
+        return
+    
+    pythoncom.CoInitialize()
+    _com_thread_state.initialized = True
+
+
+class DocumentPollerSignals(QObject):
+    """Signals for DocumentPoller; QRunnable cannot emit signals itself."""
+    
+    docs_ready = Signal(list)  # Open document info dicts
+    poll_failed = Signal(str)  # Error message
+
+
+class DocumentPoller(QRunnable):
+    """Thread pool task that lists open Word documents off the GUI thread."""
+    
+    def __init__(self, signals: DocumentPollerSignals, selector: 'DocumentSelectorWidget'):
+        super().__init__()
+        self.signals = signals
+        self.selector = selector
+    
+    def run(self):
+        """Query Word for its open documents in a pool thread."""
+        try:
+            _ensure_com_initialized()
+            documents = self.selector.get_word_manager().get_open_documents()
+            self.signals.docs_ready.emit(documents)
+            
+        except Exception as e:
+            self.signals.poll_failed.emit(str(e))
+
 
 class DocumentSelectorWidget(QWidget, LoggerMixin):
     """Widget for selecting Word documents."""
@@ -25,6 +65,7 @@ class DocumentSelectorWidget(QWidget, LoggerMixin):
     # Signals
     document_selected = Signal(dict)  # Document info dict
     refresh_requested = Signal()
+    word_documents_changed = Signal(bool)  # Word document event; True when Word is quitting
     
     def __init__(self, settings=None, parent=None):
         super().__init__(parent)
@@ -32,16 +73,44 @@ class DocumentSelectorWidget(QWidget, LoggerMixin):
         self.open_documents = []
         self.selected_document = None
         
-        # Auto-refresh timer
-        self.refresh_timer = QTimer()
+        # Word connection reused across refreshes; released in closeEvent
+        self._word_manager = None
+        self._last_docs_fingerprint = None
+        
+        # Polls run one at a time on a single long-lived thread so the Word
+        # connection always stays in the thread that created it
+        self._poll_pool = QThreadPool(self)
+        self._poll_pool.setMaxThreadCount(1)
+        self._poll_pool.setExpiryTimeout(-1)
+        self._poller_signals = DocumentPollerSignals(self)
+        self._poller_signals.docs_ready.connect(self.on_documents_ready, Qt.QueuedConnection)
+        self._poller_signals.poll_failed.connect(self.on_documents_failed, Qt.QueuedConnection)
+        self._refresh_in_flight = False
+        self._force_refresh = False
+        self._force_refresh_pending = False
+        
+        # Word event sink, attached on the GUI thread whose message loop delivers the events.
+        # One watcher is kept for the widget's lifetime; only its sink is re-attached
+        self._word_watcher = None
+        self._watching_word = False
+        self.word_documents_changed.connect(self.on_word_documents_changed, Qt.QueuedConnection)
+        
+        # Coalesces bursts of Word events into one poll; also lets a closing
+        # document finish closing before it is polled
+        self._event_refresh_timer = QTimer(self)
+        self._event_refresh_timer.setSingleShot(True)
+        self._event_refresh_timer.setInterval(300)
+        self._event_refresh_timer.timeout.connect(self.auto_refresh)
+        
+        # Fallback auto-refresh timer; runs every 5 seconds only while open documents
+        # are shown and Word events are not available
+        self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.auto_refresh)
         self.refresh_timer.setSingleShot(False)
+        self.refresh_timer.setInterval(5000)
         
         self.setup_ui()
         self.refresh()
-        
-        # Start auto-refresh every 5 seconds for open documents
-        self.refresh_timer.start(5000)
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -124,6 +193,7 @@ class DocumentSelectorWidget(QWidget, LoggerMixin):
             self.document_combo.setEnabled(True)
             self.refresh()
         
+        self.update_refresh_timer()
         self.logger.info(f"Selection method changed to: {'file' if is_file_mode else 'open_documents'}")
     
     def refresh(self):
@@ -132,86 +202,267 @@ class DocumentSelectorWidget(QWidget, LoggerMixin):
             return  # No refresh needed in file mode
         
         self.status_label.setText("Refreshing...")
+        self.start_poll(force=True)
+    
+    def start_poll(self, force: bool = False):
+        """Query open documents in the background.
         
-        # Import here to avoid circular imports
-        try:
+        A forced poll always rebuilds the combo box; other polls only do so
+        when the open documents changed.
+        """
+        if self._refresh_in_flight:
+            # Don't pile up polls; run a forced one once the current poll finishes
+            self._force_refresh_pending = self._force_refresh_pending or force
+            return
+        
+        self._refresh_in_flight = True
+        self._force_refresh = force
+        self._poll_pool.start(DocumentPoller(self._poller_signals, self))
+    
+    def _finish_poll(self):
+        """Clear the in-flight flag and start any forced poll that was queued."""
+        self._refresh_in_flight = False
+        if self._force_refresh_pending:
+            self._force_refresh_pending = False
+            self.start_poll(force=True)
+    
+    @Slot(list)
+    def on_documents_ready(self, documents: list):
+        """Update the combo box with polled documents."""
+        force = self._force_refresh
+        self._finish_poll()
+        
+        if self._refresh_in_flight or self.file_radio.isChecked():
+            return  # Superseded by a newer poll, or no longer showing open documents
+        
+        # Nothing to do while the open documents are unchanged
+        if not force and self._documents_fingerprint(documents) == self._last_docs_fingerprint:
+            return
+        
+        self.set_open_documents(documents)
+        self.logger.info(f"Refreshed documents: {len(self.open_documents)} found")
+        
+        # Word is running, so try switching from polling to Word events. Only
+        # changed, non-empty polls retry, which keeps COM calls off most ticks
+        if documents and self.attach_word_watcher():
+            self.refresh_timer.stop()
+    
+    @Slot(str)
+    def on_documents_failed(self, error_message: str):
+        """Report a failed document poll."""
+        force = self._force_refresh
+        self._finish_poll()
+        
+        self.logger.error(f"Failed to refresh documents: {error_message}")
+        if self._refresh_in_flight or not force or self.file_radio.isChecked():
+            return
+        
+        self.status_label.setText(f"Error: {error_message}")
+        self.open_documents = []
+        self._last_docs_fingerprint = None
+        self.update_document_combo()
+    
+    def get_word_manager(self):
+        """Get the shared Word manager, creating it on first use.
+        
+        Only called from the poll thread.
+        """
+        if self._word_manager is None:
+            # Import here to avoid circular imports
             from core.word_manager import WordManager
+            self._word_manager = WordManager(self.settings)
+        return self._word_manager
+    
+    def release_word_manager(self):
+        """Close the shared Word manager."""
+        if self._word_manager is not None:
+            self._word_manager.close()
+            self._word_manager = None
+    
+    def attach_word_watcher(self) -> bool:
+        """Watch a running Word instance for document events.
+        
+        Returns True if Word events are being watched, in which case polling
+        is not needed.
+        """
+        if self._watching_word:
+            return True
+        
+        if self._word_watcher is None:
+            # Import here to avoid circular imports
+            from core.word_manager import WordManager, COM_AVAILABLE
+            if not COM_AVAILABLE:
+                return False
             
-            # Get list of open documents
-            word_manager = WordManager(self.settings)
-            self.open_documents = word_manager.get_open_documents()
-            word_manager.close()
-            
-            # Update combo box
-            self.update_document_combo()
-            
-            if self.open_documents:
-                self.status_label.setText(f"Found {len(self.open_documents)} open document(s)")
-            else:
-                self.status_label.setText("No open Word documents found")
-            
-            self.logger.info(f"Refreshed documents: {len(self.open_documents)} found")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to refresh documents: {e}")
-            self.status_label.setText(f"Error: {str(e)}")
-            self.open_documents = []
-            self.update_document_combo()
+            try:
+                self._word_watcher = WordManager(self.settings)
+            except Exception as e:
+                self.logger.debug(f"Cannot create Word watcher: {e}")
+                return False
+        
+        self._watching_word = self._word_watcher.watch_documents(self.word_documents_changed.emit)
+        return self._watching_word
+    
+    def detach_word_watcher(self):
+        """Stop watching Word document events, keeping the watcher for a later attach."""
+        if self._watching_word:
+            self._watching_word = False
+            self._word_watcher.unwatch_documents()
+    
+    def release_word_watcher(self):
+        """Stop watching Word document events and close the watcher."""
+        self._watching_word = False
+        if self._word_watcher is not None:
+            self._word_watcher.close()
+            self._word_watcher = None
+    
+    @Slot(bool)
+    def on_word_documents_changed(self, quitting: bool):
+        """Refresh shortly after Word opens, saves or closes a document."""
+        if quitting:
+            # The sink dies with Word; fall back to polling until Word is back
+            self.detach_word_watcher()
+            if self.isVisible() and self.open_docs_radio.isChecked():
+                self.refresh_timer.start()
+        
+        self._event_refresh_timer.start()
+    
+    @staticmethod
+    def _document_key(doc: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Get the key that identifies a document across refreshes.
+        
+        The saved state is not part of the key, so saving or editing a document
+        updates its row in place instead of replacing it.
+        """
+        if not doc:
+            return None
+        return doc['full_name']
+    
+    @staticmethod
+    def _documents_fingerprint(documents: List[Dict[str, Any]]) -> tuple:
+        """Get a cheap summary of the open documents used to detect changes."""
+        # Includes the saved state, so a save still refreshes the "(unsaved)" marker
+        return tuple((doc['full_name'], doc['saved']) for doc in documents)
+    
+    def set_open_documents(self, documents: List[Dict[str, Any]]):
+        """Show a new list of open documents in the combo box."""
+        self.open_documents = documents
+        self._last_docs_fingerprint = self._documents_fingerprint(documents)
+        self.update_document_combo()
+        
+        if self.open_documents:
+            self.status_label.setText(f"Found {len(self.open_documents)} open document(s)")
+        else:
+            self.status_label.setText("No open Word documents found")
+    
+    def closeEvent(self, event):
+        """Stop polling and release the Word connection."""
+        self.refresh_timer.stop()
+        self._event_refresh_timer.stop()
+        self.release_word_watcher()
+        self._poll_pool.waitForDone(2000)
+        self.release_word_manager()
+        super().closeEvent(event)
+    
+    def showEvent(self, event):
+        """Resume auto-refresh when the widget is shown."""
+        super().showEvent(event)
+        self.update_refresh_timer()
+        
+        # Word events are ignored while hidden, so catch up on any that were missed
+        if self._watching_word:
+            self._event_refresh_timer.start()
+    
+    def hideEvent(self, event):
+        """Pause auto-refresh while the widget is hidden."""
+        super().hideEvent(event)
+        self.update_refresh_timer()
+    
+    def update_refresh_timer(self):
+        """Poll only while visible in open documents mode and Word events are unavailable."""
+        if not self.isVisible() or not self.open_docs_radio.isChecked() or self._watching_word:
+            self.refresh_timer.stop()
+        elif not self.refresh_timer.isActive():
+            self.refresh_timer.start()
     
     def auto_refresh(self):
         """Automatically refresh open documents (but don't change selection)."""
+        if not self.isVisible() or self.file_radio.isChecked() or self.window().isMinimized():
+            return
+        
         if self.open_docs_radio.isChecked():
-            # Save current selection
-            current_text = self.document_combo.currentText()
-            
-            # Refresh list
-            self.refresh()
-            
-            # Restore selection if possible
-            index = self.document_combo.findText(current_text)
-            if index >= 0:
-                self.document_combo.setCurrentIndex(index)
+            self.start_poll()
     
     def update_document_combo(self):
-        """Update the document combo box with available documents."""
-        self.document_combo.clear()
-        
-        if not self.open_documents:
-            self.document_combo.addItem("No open documents found")
-            self.document_combo.setEnabled(False)
-            return
+        """Update the document combo box with available documents.
         
-        self.document_combo.setEnabled(True)
+        Rows are matched to documents by key, so rows for documents that are
+        still open, and the current selection, survive the update.
+        """
+        combo = self.document_combo
+        previous_doc = combo.itemData(combo.currentIndex(), Qt.UserRole)
         
-        # Add placeholder
-        self.document_combo.addItem("Select a document...")
+        with QSignalBlocker(combo):
+            if not self.open_documents:
+                combo.clear()
+                combo.addItem("No open documents found")
+                combo.setEnabled(False)
+            else:
+                combo.setEnabled(True)
+                
+                # Start over unless the combo already lists open documents
+                if combo.count() == 0 or combo.itemText(0) != "Select a document...":
+                    combo.clear()
+                    combo.addItem("Select a document...")
+                
+                new_docs = {self._document_key(doc): doc for doc in self.open_documents}
+                current_removed = False
+                
+                # Drop rows for closed documents and refresh the rest in place
+                for row in range(combo.count() - 1, 0, -1):
+                    doc = new_docs.pop(self._document_key(combo.itemData(row, Qt.UserRole)), None)
+                    if doc is None:
+                        current_removed = current_removed or row == combo.currentIndex()
+                        combo.removeItem(row)
+                    else:
+                        combo.setItemText(row, self._document_display_name(doc))
+                        combo.setItemData(row, doc, Qt.UserRole)
+                
+                # Add newly opened documents, storing document info as user data
+                for doc in new_docs.values():
+                    combo.addItem(self._document_display_name(doc), doc)
+                
+                # Fall back to the placeholder rather than another document
+                if current_removed:
+                    combo.setCurrentIndex(0)
         
-        # Add open documents
-        for doc in self.open_documents:
-            display_name = doc['name']
-            if not doc['saved']:
-                display_name += " (unsaved)"
-            
-            self.document_combo.addItem(display_name)
-            
-            # Store document info as user data
-            self.document_combo.setItemData(
-                self.document_combo.count() - 1, 
-                doc, 
-                Qt.UserRole
-            )
+        # Signals were blocked, so report a selection change explicitly
+        current_doc = combo.itemData(combo.currentIndex(), Qt.UserRole)
+        if self._document_key(current_doc) != self._document_key(previous_doc):
+            self.on_document_changed(combo.currentText())
+        elif current_doc is not None and self.selected_document is not None:
+            self.selected_document = current_doc
+    
+    @staticmethod
+    def _document_display_name(doc: Dict[str, Any]) -> str:
+        """Get the combo box text for a document."""
+        display_name = doc['name']
+        if not doc['saved']:
+            display_name += " (unsaved)"
+        return display_name
     
     def browse_document(self):
         """Browse for a Word document file."""
-        file_path, _ = QFileDialog.getOpenFileNames(
+        file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Word Document",
             self.settings.last_directory if self.settings else "",
-            "Word Documents (*.docx *.doc);;All Files (*)"
+            "Word Documents (*.docx *.doc);;All Files (*)",
+            "",
+            QFileDialog.DontResolveSymlinks | QFileDialog.ReadOnly
         )
         
         if file_path:
-            file_path = file_path[0]  # Take first selected file
             # Create document info for the selected file
             file_path = Path(file_path)
             doc_info = {
@@ -225,8 +476,8 @@ class DocumentSelectorWidget(QWidget, LoggerMixin):
             
             # Update combo and select this document
             self.document_combo.clear()
-            self.document_combo.addItem(f"📄 {file_path.name}")
-            self.document_combo.setItemData(0, doc_info, Qt.UserRole)
+            # Add the item with its data so the change signal sees the document info
+            self.document_combo.addItem(f"📄 {file_path.name}", doc_info)
             self.document_combo.setCurrentIndex(0)
             
             # Update status
@@ -279,7 +530,6 @@ class DocumentSelectorWidget(QWidget, LoggerMixin):
         
         # Stop auto-refresh when disabled
         if enabled:
-            if not self.refresh_timer.isActive():
-                self.refresh_timer.start(5000)
+            self.update_refresh_timer()
         else:
             self.refresh_timer.stop() 
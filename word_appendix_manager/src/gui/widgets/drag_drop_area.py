@@ -3,19 +3,83 @@ Drag and Drop Area Widget
 Provides a user-friendly drag and drop interface for PDF files.
 """
 
-import sys
-from pathlib import Path
-
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
+import os
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
-from PySide6.QtCore import Qt, Signal, QMimeData, QUrl, QTimer
+from PySide6.QtCore import Qt, Signal, QMimeData, QUrl, QTimer, QElapsedTimer, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QDragEnterEvent, QDropEvent, QPaintEvent, QPainter
 from typing import List
 
 from utils.logger import get_logger, LoggerMixin
 
+# Message colors per message type: (text/border color, background color)
+MESSAGE_COLORS = {
+    'error': ("#d32f2f", "rgba(255, 235, 238, 220)"),
+    'warning': ("#f57c00", "rgba(255, 248, 225, 220)"),
+    'success': ("#388e3c", "rgba(232, 245, 233, 220)"),
+    'info': ("#1976d2", "rgba(227, 242, 253, 220)"),
+}
+
+# Complete message label stylesheets, built once so showing a message does not
+# format a new stylesheet for Qt to parse
+_MESSAGE_STYLESHEETS = {
+    message_type: f"""
+            QLabel {{
+                background-color: {bg_color};
+                border: 1px solid {color};
+                border-radius: 4px;
+                padding: 8px;
+                font-weight: bold;
+                color: {color};
+            }}
+        """
+    for message_type, (color, bg_color) in MESSAGE_COLORS.items()
+}
+
+
+def filter_pdf_paths(file_paths: List[str]) -> List[str]:
+    """Keep the paths of existing PDF files, with native path separators.
+    
+    Non-PDF names are rejected before the filesystem is touched, so only
+    PDF candidates cost a stat() call.
+    """
+    pdf_paths = []
+    
+    for file_path in file_paths:
+        if not file_path.lower().endswith('.pdf'):
+            continue
+        
+        if os.path.isfile(file_path):
+            # Normalize to native path separators
+            pdf_paths.append(os.path.normpath(file_path))
+    
+    return pdf_paths
+
+
+class DropValidatorSignals(QObject):
+    """Signals for DropValidator; QRunnable cannot emit signals itself."""
+    
+    finished = Signal(list)  # List of valid PDF file paths
+
+
+class DropValidator(QRunnable):
+    """Thread pool task that checks a large batch of dropped files off the GUI thread."""
+    
+    def __init__(self, signals: DropValidatorSignals, file_paths: List[str]):
+        super().__init__()
+        self.signals = signals
+        self.file_paths = file_paths
+    
+    def run(self):
+        """Filter the dropped paths in a pool thread."""
+        try:
+            pdf_paths = filter_pdf_paths(self.file_paths)
+        except Exception as e:
+            get_logger(__name__).error("Failed to validate dropped files: %s", e)
+            pdf_paths = []
+        
+        self.signals.finished.emit(pdf_paths)
+
 
 class DragDropArea(QFrame, LoggerMixin):
     """Drag and drop area for PDF files."""
@@ -23,9 +87,76 @@ class DragDropArea(QFrame, LoggerMixin):
     # Signals
     files_dropped = Signal(list)  # List of file paths
     
+    # Drops of more local files than this are checked in the thread pool
+    ASYNC_DROP_THRESHOLD = 50
+    
+    # How long a message stays on the area
+    MESSAGE_TIMEOUT_MS = 3000
+    
+    # Minimum time between re-validations of unfamiliar mime data during a drag (one frame)
+    DRAG_RECHECK_MS = 16
+    
+    # Frame style sheets for each state, shared by all instances
+    _STYLE_NORMAL = """
+        QFrame {
+            border: 2px dashed #ccc;
+            border-radius: 8px;
+            background-color: #fafafa;
+        }
+        QFrame:hover {
+            border-color: #2196f3;
+            background-color: #f0f8ff;
+        }
+    """
+    
+    _STYLE_DRAG = """
+        QFrame {
+            border: 2px dashed #2196f3;
+            border-radius: 8px;
+            background-color: #e3f2fd;
+            color: #1976d2;
+        }
+    """
+    
+    _STYLE_ERROR = """
+        QFrame {
+            border: 2px dashed #f44336;
+            border-radius: 8px;
+            background-color: #ffebee;
+            color: #d32f2f;
+        }
+    """
+    
+    _STYLE_DISABLED = """
+        QFrame {
+            border: 2px dashed #ddd;
+            border-radius: 8px;
+            background-color: #f5f5f5;
+            color: #bbb;
+        }
+    """
+    
+    _STYLES = {
+        'normal': _STYLE_NORMAL,
+        'drag': _STYLE_DRAG,
+        'error': _STYLE_ERROR,
+        'disabled': _STYLE_DISABLED,
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.is_dragging = False
+        self._style_state = None  # Key of the frame style currently applied
+        
+        # Validity of the current drag, decided on drag enter; the mime data
+        # does not change while the drag is in progress
+        self._drag_valid = False
+        self._drag_mime_id = None
+        self._drag_check_timer = QElapsedTimer()
+        
+        self._validator_signals = DropValidatorSignals(self)
+        self._validator_signals.finished.connect(self.on_drop_validated, Qt.QueuedConnection)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -39,101 +170,66 @@ class DragDropArea(QFrame, LoggerMixin):
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(10)
         
-        # Icon/visual indicator
-        icon_label = QLabel("📁")
-        icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("""
-            QLabel {
-                font-size: 48px;
-                color: #666;
-                margin: 10px;
-            }
-        """)
-        layout.addWidget(icon_label)
+        # Icon and hint text in a single rich-text label; the frame style sheet is
+        # the only one that changes during drags
+        hint_label = QLabel(
+            "<div align='center'>"
+            "<p style='margin: 10px; font-size: 48px; color: #666;'>📁</p>"
+            "<p style='margin: 5px; font-size: 16px; font-weight: bold; color: #333;'>Drop PDF files here</p>"
+            "<p style='margin: 5px; font-size: 12px; font-style: italic; color: #666;'>or click Browse to select files</p>"
+            "<p style='margin: 5px; font-size: 10px; color: #999;'>Supported: PDF files only</p>"
+            "</div>"
+        )
+        hint_label.setTextFormat(Qt.RichText)
+        hint_label.setAlignment(Qt.AlignCenter)
         
-        # Primary text
-        primary_label = QLabel("Drop PDF files here")
-        primary_label.setAlignment(Qt.AlignCenter)
-        primary_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333;
-                margin: 5px;
-            }
-        """)
-        layout.addWidget(primary_label)
+        # QLabel is a QFrame, so keep the frame's dashed border off the label
+        hint_label.setStyleSheet("QLabel { border: none; background: transparent; }")
+        layout.addWidget(hint_label)
         
-        # Secondary text
-        secondary_label = QLabel("or click Browse to select files")
-        secondary_label.setAlignment(Qt.AlignCenter)
-        secondary_label.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                color: #666;
-                font-style: italic;
-                margin: 5px;
-            }
-        """)
-        layout.addWidget(secondary_label)
+        # Overlay label for temporary messages, positioned by hand over the hint
+        self.message_label = QLabel(self)
+        self.message_label.setAlignment(Qt.AlignCenter)
+        self.message_label.hide()
+        self.message_type = None
+        self._message_text = None
         
-        # Supported formats text
-        formats_label = QLabel("Supported: PDF files only")
-        formats_label.setAlignment(Qt.AlignCenter)
-        formats_label.setStyleSheet("""
-            QLabel {
-                font-size: 10px;
-                color: #999;
-                margin: 5px;
-            }
-        """)
-        layout.addWidget(formats_label)
+        # One hide timer, restarted by each message so repeated messages extend it
+        self._message_timer = QTimer(self)
+        self._message_timer.setSingleShot(True)
+        self._message_timer.setInterval(self.MESSAGE_TIMEOUT_MS)
+        self._message_timer.timeout.connect(self.message_label.hide)
         
         # Set initial styling
         self.set_normal_style()
     
     def set_normal_style(self):
         """Set normal (non-dragging) style."""
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #ccc;
-                border-radius: 8px;
-                background-color: #fafafa;
-            }
-            QFrame:hover {
-                border-color: #2196f3;
-                background-color: #f0f8ff;
-            }
-        """)
+        self._apply_style('normal')
     
     def set_drag_style(self):
         """Set dragging style."""
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #2196f3;
-                border-radius: 8px;
-                background-color: #e3f2fd;
-                color: #1976d2;
-            }
-        """)
+        self._apply_style('drag')
     
     def set_error_style(self):
         """Set error style for invalid drops."""
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #f44336;
-                border-radius: 8px;
-                background-color: #ffebee;
-                color: #d32f2f;
-            }
-        """)
+        self._apply_style('error')
         
         # Reset to normal after a short delay
         QTimer.singleShot(1000, self.set_normal_style)
     
+    def _apply_style(self, state: str):
+        """Apply the frame style for a state; re-applying the current style is skipped."""
+        if state == self._style_state:
+            return
+        
+        self._style_state = state
+        self.setStyleSheet(self._STYLES[state])
+    
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event."""
-        if self.has_valid_urls(event.mimeData()):
+        self._remember_drag_validity(event.mimeData())
+        if self._drag_valid:
             self.is_dragging = True
             self.set_drag_style()
             event.acceptProposedAction()
@@ -143,31 +239,58 @@ class DragDropArea(QFrame, LoggerMixin):
             self.logger.debug("Drag enter: no valid files")
     
     def dragMoveEvent(self, event):
-        """Handle drag move event."""
-        if self.has_valid_urls(event.mimeData()):
+        """Handle drag move event, reusing the validity decided on drag enter."""
+        mime_data = event.mimeData()
+        if id(mime_data) != self._drag_mime_id and self._drag_check_timer.hasExpired(self.DRAG_RECHECK_MS):
+            self._remember_drag_validity(mime_data)
+        
+        if self._drag_valid:
             event.acceptProposedAction()
         else:
             event.ignore()
     
+    def _remember_drag_validity(self, mime_data: QMimeData):
+        """Validate the dragged mime data and remember the result for the rest of the drag."""
+        self._drag_valid = self.has_valid_urls(mime_data)
+        self._drag_mime_id = id(mime_data)
+        self._drag_check_timer.start()
+    
+    def _forget_drag_validity(self):
+        """Forget the validity of a finished drag."""
+        self._drag_valid = False
+        self._drag_mime_id = None
+    
     def dragLeaveEvent(self, event):
         """Handle drag leave event."""
         self.is_dragging = False
+        self._forget_drag_validity()
         self.set_normal_style()
         self.logger.debug("Drag leave")
     
     def dropEvent(self, event: QDropEvent):
         """Handle drop event."""
         self.is_dragging = False
+        self._forget_drag_validity()
         
         mime_data = event.mimeData()
         if mime_data.hasUrls():
-            file_paths = self.extract_pdf_paths(mime_data)
+            # Copy the paths out now; the mime data is gone once the event returns
+            local_paths = [url.toLocalFile() for url in mime_data.urls() if url.isLocalFile()]
+            
+            if len(local_paths) > self.ASYNC_DROP_THRESHOLD and self.has_valid_urls(mime_data):
+                event.acceptProposedAction()
+                self.show_message(f"Validating {len(local_paths)} files...", "info")
+                QThreadPool.globalInstance().start(DropValidator(self._validator_signals, local_paths))
+                self.logger.debug("Drop event: validating %d files in the background", len(local_paths))
+                return
+            
+            file_paths = filter_pdf_paths(local_paths)
             
             if file_paths:
                 self.set_normal_style()
                 self.files_dropped.emit(file_paths)
                 event.acceptProposedAction()
-                self.logger.info(f"Files dropped: {len(file_paths)} PDF files")
+                self.logger.info("Files dropped: %d PDF files", len(file_paths))
             else:
                 self.set_error_style()
                 event.ignore()
@@ -177,33 +300,35 @@ class DragDropArea(QFrame, LoggerMixin):
             event.ignore()
             self.logger.warning("Drop event: no URLs in mime data")
     
+    def on_drop_validated(self, file_paths: List[str]):
+        """Handle the result of a background drop validation."""
+        self._message_timer.stop()
+        self.message_label.hide()
+        
+        if file_paths:
+            self.set_normal_style()
+            self.files_dropped.emit(file_paths)
+            self.logger.info("Files dropped: %d PDF files", len(file_paths))
+        else:
+            self.set_error_style()
+            self.logger.warning("Drop event: no valid PDF files found")
+    
     def has_valid_urls(self, mime_data: QMimeData) -> bool:
-        """Check if mime data contains valid file URLs."""
+        """Check if mime data contains at least one local PDF URL.
+        
+        Only the file name is checked, without touching the filesystem, so drag
+        feedback stays instant on slow drives; filter_pdf_paths (or DropValidator
+        for large drops) checks the files themselves on drop.
+        """
         if not mime_data.hasUrls():
             return False
         
-        urls = mime_data.urls()
-        for url in urls:
-            if url.isLocalFile():
-                file_path = Path(url.toLocalFile())
-                if file_path.is_file() and file_path.suffix.lower() == '.pdf':
-                    return True
+        for url in mime_data.urls():
+            if url.isLocalFile() and url.toLocalFile().lower().endswith('.pdf'):
+                return True
         
         return False
     
-    def extract_pdf_paths(self, mime_data: QMimeData) -> List[str]:
-        """Extract PDF file paths from mime data."""
-        pdf_paths = []
-        
-        if mime_data.hasUrls():
-            for url in mime_data.urls():
-                if url.isLocalFile():
-                    file_path = Path(url.toLocalFile())
-                    if file_path.is_file() and file_path.suffix.lower() == '.pdf':
-                        pdf_paths.append(str(file_path))
-        
-        return pdf_paths
-    
     def mousePressEvent(self, event):
         """Handle mouse press for click-to-browse functionality."""
         if event.button() == Qt.LeftButton:
@@ -215,14 +340,7 @@ class DragDropArea(QFrame, LoggerMixin):
         super().setEnabled(enabled)
         
         if not enabled:
-            self.setStyleSheet("""
-                QFrame {
-                    border: 2px dashed #ddd;
-                    border-radius: 8px;
-                    background-color: #f5f5f5;
-                    color: #bbb;
-                }
-            """)
+            self._apply_style('disabled')
             self.setAcceptDrops(False)
         else:
             self.set_normal_style()
@@ -230,46 +348,34 @@ class DragDropArea(QFrame, LoggerMixin):
     
     def show_message(self, message: str, message_type: str = "info"):
         """Show a temporary message on the drag drop area."""
-        # Create a temporary label to show messages
-        if not hasattr(self, 'message_label'):
-            self.message_label = QLabel(self)
-            self.message_label.setAlignment(Qt.AlignCenter)
-            self.message_label.hide()
+        # Style based on message type; unknown types are shown as info
+        if message_type not in _MESSAGE_STYLESHEETS:
+            message_type = "info"
         
-        # Style based on message type
-        if message_type == "error":
-            color = "#d32f2f"
-            bg_color = "rgba(255, 235, 238, 220)"
-        elif message_type == "warning":
-            color = "#f57c00"
-            bg_color = "rgba(255, 248, 225, 220)"
-        elif message_type == "success":
-            color = "#388e3c"
-            bg_color = "rgba(232, 245, 233, 220)"
-        else:  # info
-            color = "#1976d2"
-            bg_color = "rgba(227, 242, 253, 220)"
+        restyled = message_type != self.message_type
+        if restyled:
+            self.message_label.setStyleSheet(_MESSAGE_STYLESHEETS[message_type])
+            self.message_type = message_type
         
-        self.message_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                border: 1px solid {color};
-                border-radius: 4px;
-                padding: 8px;
-                font-weight: bold;
-                color: {color};
-            }}
-        """)
+        # Size and position only change with the text or style
+        if restyled or message != self._message_text:
+            self.message_label.setText(message)
+            self._message_text = message
+            self.message_label.adjustSize()
+            self._center_message_label()
         
-        # Set message and show
-        self.message_label.setText(message)
-        self.message_label.adjustSize()
+        self.message_label.show()
         
-        # Center the label
+        # Hide after 3 seconds
+        self._message_timer.start()
+    
+    def _center_message_label(self):
+        """Center the message label over the area."""
         label_x = (self.width() - self.message_label.width()) // 2
         label_y = (self.height() - self.message_label.height()) // 2
         self.message_label.move(label_x, label_y)
-        self.message_label.show()
-        
-        # Hide after 3 seconds
-        QTimer.singleShot(3000, self.message_label.hide)
\ No newline at end of file
+    
+    def resizeEvent(self, event):
+        """Keep the message label centered when the area is resized."""
+        super().resizeEvent(event)
+        self._center_message_label()
\ No newline at end of file
@@ -3,49 +3,145 @@ PDF Preview Widget
 Provides a preview of PDF files with thumbnail display.
 """
 
-import sys
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QScrollArea, QFrame, QSpinBox
 )
-from PySide6.QtCore import Qt, Signal, QThread
+from PySide6.QtCore import Qt, Signal, Slot, QThread, QObject, QRunnable, QThreadPool, QTimer
 from PySide6.QtGui import QPixmap, QFont
-from typing import Optional
+from typing import Optional, Dict, Any, Tuple
 
+from core.pdf_handler import PDFHandler
 from utils.logger import get_logger, LoggerMixin
 
 
+# Rendered thumbnails keyed by (pdf_path, file stamp, page_number, max size), most recent last;
+# shared by the worker threads, so guarded by a lock
+THUMBNAIL_CACHE_SIZE = 32
+_thumbnail_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_thumbnail_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_pdf_handler() -> PDFHandler:
+    """Get the PDFHandler shared by all previews.
+    
+    The handler itself keeps no per-call state; PyMuPDF is not thread-safe,
+    so PDFHandler serializes its MuPDF calls across all threads.
+    """
+    return PDFHandler()
+
+
+def _file_stamp(pdf_path: str) -> Tuple[int, int]:
+    """Get (mtime, size) of a file, so cache entries of edited PDFs go stale."""
+    stat = os.stat(pdf_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=64)
+def _validate_cached(pdf_path: str, stamp: Tuple[int, int]) -> Dict[str, Any]:
+    """Validate a PDF once per file version; the returned dict is shared, so don't modify it."""
+    return get_pdf_handler().validate_pdf_file(pdf_path)
+
+
+def validate_pdf_cached(pdf_path: str) -> Dict[str, Any]:
+    """Get PDF info, reusing the result for an unchanged file."""
+    return _validate_cached(pdf_path, _file_stamp(pdf_path))
+
+
+def get_thumbnail_cached(pdf_path: str, page_number: int,
+                         max_size: Optional[Tuple[int, int]] = None) -> Optional[bytes]:
+    """Render a PDF page thumbnail fitting max_size, reusing recent renders of an unchanged file."""
+    key = (pdf_path, _file_stamp(pdf_path), page_number, max_size)
+    with _thumbnail_cache_lock:
+        thumbnail_data = _thumbnail_cache.get(key)
+        if thumbnail_data is not None:
+            _thumbnail_cache.move_to_end(key)
+            return thumbnail_data
+    
+    max_width, max_height = max_size or (None, None)
+    thumbnail_data = get_pdf_handler().get_pdf_thumbnail(pdf_path, page_number, max_width, max_height)
+    
+    if thumbnail_data:
+        with _thumbnail_cache_lock:
+            _thumbnail_cache[key] = thumbnail_data
+            _thumbnail_cache.move_to_end(key)
+            while len(_thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+                _thumbnail_cache.popitem(last=False)
+    
+    return thumbnail_data
+
+
 class ThumbnailWorker(QThread):
     """Worker thread for generating PDF thumbnails."""
     
     thumbnail_ready = Signal(bytes)  # Thumbnail image data
     thumbnail_failed = Signal(str)   # Error message
     
-    def __init__(self, pdf_path: str, page_number: int = 0):
-        super().__init__()
+    def __init__(self, pdf_path: str, page_number: int = 0,
+                 max_size: Optional[Tuple[int, int]] = None, parent=None):
+        super().__init__(parent)
         self.pdf_path = pdf_path
         self.page_number = page_number
+        self.max_size = max_size
+        self._cancelled = False
+    
+    def cancel(self):
+        """Ask the worker not to report its result; the render itself finishes normally."""
+        self._cancelled = True
     
     def run(self):
         """Generate thumbnail in background thread."""
         try:
-            from core.pdf_handler import PDFHandler
-            
-            pdf_handler = PDFHandler()
-            thumbnail_data = pdf_handler.get_pdf_thumbnail(self.pdf_path, self.page_number)
+            thumbnail_data = get_thumbnail_cached(self.pdf_path, self.page_number, self.max_size)
             
+            if self._cancelled:
+                return
             if thumbnail_data:
                 self.thumbnail_ready.emit(thumbnail_data)
             else:
                 self.thumbnail_failed.emit("Could not generate thumbnail")
                 
         except Exception as e:
-            self.thumbnail_failed.emit(str(e))
+            if not self._cancelled:
+                self.thumbnail_failed.emit(str(e))
+
+
+class PreviewLoaderSignals(QObject):
+    """Signals for PreviewLoader; QRunnable cannot emit signals itself."""
+    
+    preview_ready = Signal(int, dict, bytes)  # Load token, PDF info, thumbnail image data
+    preview_failed = Signal(int, str)         # Load token, error message
+
+
+class PreviewLoader(QRunnable):
+    """Thread pool task that reads PDF info and renders the preview page off the GUI thread."""
+    
+    def __init__(self, signals: PreviewLoaderSignals, token: int, pdf_path: str, page_number: int = 0,
+                 max_size: Optional[Tuple[int, int]] = None):
+        super().__init__()
+        self.signals = signals
+        self.token = token
+        self.pdf_path = pdf_path
+        self.page_number = page_number
+        self.max_size = max_size
+    
+    def run(self):
+        """Load PDF info and thumbnail in a pool thread."""
+        try:
+            pdf_info = validate_pdf_cached(self.pdf_path)
+            thumbnail_data = get_thumbnail_cached(self.pdf_path, self.page_number, self.max_size)
+            
+            self.signals.preview_ready.emit(self.token, pdf_info, thumbnail_data or b"")
+            
+        except Exception as e:
+            self.signals.preview_failed.emit(self.token, str(e))
 
 
 class PDFPreviewWidget(QWidget, LoggerMixin):
@@ -54,6 +150,56 @@ class PDFPreviewWidget(QWidget, LoggerMixin):
     # Signals
     page_changed = Signal(int)  # New page number
     
+    # Delay before rendering a newly selected page, so only the last page of a burst is rendered
+    THUMBNAIL_DEBOUNCE_MS = 180
+    
+    # Preview label style sheets for each state, shared by all instances
+    _STYLE_EMPTY = """
+        QLabel {
+            color: #999;
+            font-size: 14pt;
+            background-color: #fafafa;
+            border: 2px dashed #ddd;
+            border-radius: 8px;
+            margin: 20px;
+            padding: 40px;
+        }
+    """
+    
+    _STYLE_LOADING = """
+        QLabel {
+            color: #666;
+            font-size: 12pt;
+            background-color: white;
+            border: 1px solid #eee;
+            border-radius: 4px;
+            margin: 10px;
+            padding: 20px;
+        }
+    """
+    
+    _STYLE_THUMBNAIL = """
+        QLabel {
+            background-color: white;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            margin: 10px;
+            padding: 10px;
+        }
+    """
+    
+    _STYLE_ERROR = """
+        QLabel {
+            color: #d32f2f;
+            font-size: 12pt;
+            background-color: #ffebee;
+            border: 2px solid #f44336;
+            border-radius: 8px;
+            margin: 20px;
+            padding: 30px;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_pdf_path = None
@@ -61,6 +207,18 @@ class PDFPreviewWidget(QWidget, LoggerMixin):
         self.total_pages = 0
         self.thumbnail_worker = None
         
+        # Each load_pdf call gets a new token; results for older tokens are stale and dropped
+        self._load_token = 0
+        self._loader_signals = PreviewLoaderSignals(self)
+        self._loader_signals.preview_ready.connect(self.on_preview_ready, Qt.QueuedConnection)
+        self._loader_signals.preview_failed.connect(self.on_preview_failed, Qt.QueuedConnection)
+        
+        # Page navigation restarts this timer; the thumbnail is rendered once it fires
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(self.THUMBNAIL_DEBOUNCE_MS)
+        self._load_timer.timeout.connect(self._do_load_thumbnail)
+        
         self.setup_ui()
         self.show_empty_state()
     
@@ -165,22 +323,15 @@ class PDFPreviewWidget(QWidget, LoggerMixin):
         """Show empty state when no PDF is loaded."""
         self.preview_label.clear()
         self.preview_label.setText("📄\n\nNo PDF selected\n\nSelect an appendix to preview")
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                color: #999;
-                font-size: 14pt;
-                background-color: #fafafa;
-                border: 2px dashed #ddd;
-                border-radius: 8px;
-                margin: 20px;
-                padding: 40px;
-            }
-        """)
+        self.preview_label.setStyleSheet(self._STYLE_EMPTY)
         
         self.filename_label.setText("No PDF selected")
         self.details_label.setText("")
         self.nav_frame.setVisible(False)
         
+        self._load_token += 1  # Discard any load still in flight
+        self._load_timer.stop()
+        self.cancel_thumbnail_worker()
         self.current_pdf_path = None
         self.current_page = 0
         self.total_pages = 0
@@ -197,132 +348,188 @@ class PDFPreviewWidget(QWidget, LoggerMixin):
         # Update header info
         pdf_file = Path(pdf_path)
         self.filename_label.setText(pdf_file.name)
+        self.details_label.setText("")
+        self.nav_frame.setVisible(False)
+        self.show_loading_state()
         
-        # Get PDF info
-        try:
-            from core.pdf_handler import PDFHandler
-            pdf_handler = PDFHandler()
-            pdf_info = pdf_handler.validate_pdf_file(pdf_path)
-            
-            self.total_pages = pdf_info.get('page_count', 0)
-            size_mb = pdf_info.get('size_mb', 0)
-            orientation = pdf_info.get('orientation', 'Unknown')
-            
-            self.details_label.setText(
-                f"{self.total_pages} pages • {size_mb:.1f} MB • {orientation.title()}"
-            )
-            
-            # Update navigation controls
-            if self.total_pages > 1:
-                self.nav_frame.setVisible(True)
-                self.page_spinbox.setMaximum(self.total_pages)
-                self.page_spinbox.setValue(page_number + 1)
-                self.total_pages_label.setText(f"of {self.total_pages}")
-                self.update_navigation_buttons()
-            else:
-                self.nav_frame.setVisible(False)
-            
-            # Load thumbnail
-            self.load_thumbnail()
-            
-            self.logger.info(f"Loaded PDF preview: {pdf_file.name}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to load PDF info: {e}")
-            self.details_label.setText(f"Error: {str(e)}")
-            self.show_error_state(str(e))
+        # Read PDF info and render the page in the thread pool
+        self._load_timer.stop()
+        self.cancel_thumbnail_worker()
+        self._load_token += 1
+        loader = PreviewLoader(self._loader_signals, self._load_token, pdf_path, page_number,
+                               self.thumbnail_render_size())
+        QThreadPool.globalInstance().start(loader)
+    
+    def on_preview_ready(self, token: int, pdf_info: dict, thumbnail_data: bytes):
+        """Apply PDF info and thumbnail produced by a PreviewLoader."""
+        if token != self._load_token:
+            return  # Another PDF was selected meanwhile
+        
+        self.total_pages = pdf_info.get('page_count', 0)
+        size_mb = pdf_info.get('size_mb', 0)
+        orientation = pdf_info.get('orientation', 'Unknown')
+        
+        self.details_label.setText(
+            f"{self.total_pages} pages • {size_mb:.1f} MB • {orientation.title()}"
+        )
+        
+        # Update navigation controls
+        if self.total_pages > 1:
+            self.nav_frame.setVisible(True)
+            self.page_spinbox.setMaximum(self.total_pages)
+            self.page_spinbox.setValue(self.current_page + 1)
+            self.total_pages_label.setText(f"of {self.total_pages}")
+            self.update_navigation_buttons()
+        else:
+            self.nav_frame.setVisible(False)
+        
+        if thumbnail_data:
+            self.on_thumbnail_ready(thumbnail_data)
+        else:
+            self.on_thumbnail_failed("Could not generate thumbnail")
+        
+        self.logger.info("Loaded PDF preview: %s", os.path.basename(self.current_pdf_path))
+    
+    def on_preview_failed(self, token: int, error_message: str):
+        """Handle a failed PreviewLoader."""
+        if token != self._load_token:
+            return
+        
+        self.logger.error("Failed to load PDF info: %s", error_message)
+        self.details_label.setText(f"Error: {error_message}")
+        self.show_error_state(error_message)
     
     def load_thumbnail(self):
-        """Load thumbnail for current page."""
+        """Schedule loading the thumbnail for the current page.
+        
+        Repeated calls within THUMBNAIL_DEBOUNCE_MS only render the last page.
+        """
         if not self.current_pdf_path:
             return
         
-        # Show loading state
-        self.preview_label.clear()
-        self.preview_label.setText("Loading preview...")
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 12pt;
-                background-color: white;
-                border: 1px solid #eee;
-                border-radius: 4px;
-                margin: 10px;
-                padding: 20px;
-            }
-        """)
+        self.show_loading_state()
+        self._load_timer.start()
+    
+    @Slot()
+    def _do_load_thumbnail(self):
+        """Load thumbnail for current page."""
+        if not self.current_pdf_path:
+            return
         
         # Cancel previous thumbnail generation
-        if self.thumbnail_worker and self.thumbnail_worker.isRunning():
-            self.thumbnail_worker.terminate()
-            self.thumbnail_worker.wait()
+        self.cancel_thumbnail_worker()
         
-        # Start thumbnail generation
-        self.thumbnail_worker = ThumbnailWorker(self.current_pdf_path, self.current_page)
+        # Start thumbnail generation; finished workers are deleted, including cancelled ones
+        self.thumbnail_worker = ThumbnailWorker(self.current_pdf_path, self.current_page,
+                                                self.thumbnail_render_size(), self)
         self.thumbnail_worker.thumbnail_ready.connect(self.on_thumbnail_ready)
         self.thumbnail_worker.thumbnail_failed.connect(self.on_thumbnail_failed)
+        self.thumbnail_worker.finished.connect(self.on_thumbnail_worker_finished)
         self.thumbnail_worker.start()
     
+    @Slot()
+    def on_thumbnail_worker_finished(self):
+        """Delete a thumbnail worker once its thread has exited."""
+        worker = self.sender()
+        if worker is self.thumbnail_worker:
+            self.thumbnail_worker = None
+        worker.deleteLater()
+    
+    def cancel_thumbnail_worker(self):
+        """Ignore the running thumbnail worker's result without blocking on it."""
+        worker = self.thumbnail_worker
+        if worker is None:
+            return
+        
+        self.thumbnail_worker = None
+        worker.cancel()
+        worker.thumbnail_ready.disconnect(self.on_thumbnail_ready)
+        worker.thumbnail_failed.disconnect(self.on_thumbnail_failed)
+    
+    def show_loading_state(self):
+        """Show loading state while a preview is being generated."""
+        self.preview_label.clear()
+        self.preview_label.setText("Loading preview...")
+        self.preview_label.setStyleSheet(self._STYLE_LOADING)
+    
+    def thumbnail_target_size(self) -> Tuple[int, int]:
+        """Get the size in pixels that a thumbnail is shown at."""
+        # Compute available size (subtract margins)
+        margins = self.scroll_area.contentsMargins()
+        preview_size = self.scroll_area.size()
+        available_width = preview_size.width() - (margins.left() + margins.right())
+        available_height = preview_size.height() - (margins.top() + margins.bottom())
+        return max(1, available_width - 40), max(1, available_height - 40)
+    
+    def thumbnail_render_size(self) -> Optional[Tuple[int, int]]:
+        """Get the size to render thumbnails at, or None for the default size.
+        
+        Before the preview is laid out its size is meaningless, so the default
+        size is rendered and scaled on display instead.
+        """
+        if not self.isVisible():
+            return None
+        return self.thumbnail_target_size()
+    
+    def _fit_pixmap(self, pixmap: QPixmap) -> QPixmap:
+        """Fit a thumbnail into the preview area, scaling only when it has to."""
+        target_width, target_height = self.thumbnail_target_size()
+        width_over = pixmap.width() > target_width + 1
+        height_over = pixmap.height() > target_height + 1
+        
+        # A cheap transform is enough while the user is still paging; the
+        # settled page is rendered again
+        if self._load_timer.isActive():
+            transform = Qt.FastTransformation
+        else:
+            transform = Qt.SmoothTransformation
+        
+        if width_over and height_over:
+            return pixmap.scaled(target_width, target_height, Qt.KeepAspectRatio, transform)
+        if width_over:
+            return pixmap.scaledToWidth(target_width, transform)
+        if height_over:
+            return pixmap.scaledToHeight(target_height, transform)
+        
+        # Thumbnails are normally rendered at the target size already; one
+        # rendered at the default size before the preview was laid out is
+        # scaled up to fill it
+        if abs(pixmap.width() - target_width) > 1 and abs(pixmap.height() - target_height) > 1:
+            return pixmap.scaled(target_width, target_height, Qt.KeepAspectRatio, transform)
+        
+        return pixmap
+    
     def on_thumbnail_ready(self, thumbnail_data: bytes):
         """Handle thumbnail generation completion."""
         try:
-            # Create pixmap from thumbnail data
+            # Create pixmap from thumbnail data; the format is known, so Qt
+            # does not have to sniff it
             pixmap = QPixmap()
-            pixmap.loadFromData(thumbnail_data)
+            pixmap.loadFromData(thumbnail_data, PDFHandler.THUMBNAIL_FORMAT)
             
             if not pixmap.isNull():
-                # Compute available size (subtract margins)
-                margins = self.scroll_area.contentsMargins()
-                preview_size = self.scroll_area.size()
-                available_width = preview_size.width() - (margins.left() + margins.right())
-                available_height = preview_size.height() - (margins.top() + margins.bottom())
-                
-                # Scale pixmap to fit preview area while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    max(1, available_width - 40),
-                    max(1, available_height - 40),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
+                pixmap = self._fit_pixmap(pixmap)
                 
-                self.preview_label.setPixmap(scaled_pixmap)
-                self.preview_label.setStyleSheet("""
-                    QLabel {
-                        background-color: white;
-                        border: 1px solid #ddd;
-                        border-radius: 4px;
-                        margin: 10px;
-                        padding: 10px;
-                    }
-                """)
+                self.preview_label.setPixmap(pixmap)
+                self.preview_label.setStyleSheet(self._STYLE_THUMBNAIL)
             else:
                 self.show_error_state("Invalid thumbnail data")
                 
         except Exception as e:
-            self.logger.error(f"Failed to display thumbnail: {e}")
+            self.logger.error("Failed to display thumbnail: %s", e)
             self.show_error_state(str(e))
 
     
     def on_thumbnail_failed(self, error_message: str):
         """Handle thumbnail generation failure."""
-        self.logger.error(f"Thumbnail generation failed: {error_message}")
+        self.logger.error("Thumbnail generation failed: %s", error_message)
         self.show_error_state(error_message)
     
     def show_error_state(self, error_message: str):
         """Show error state in preview."""
         self.preview_label.clear()
         self.preview_label.setText(f"❌\n\nPreview Error\n\n{error_message}")
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                color: #d32f2f;
-                font-size: 12pt;
-                background-color: #ffebee;
-                border: 2px solid #f44336;
-                border-radius: 8px;
-                margin: 20px;
-                padding: 30px;
-            }
-        """)
+        self.preview_label.setStyleSheet(self._STYLE_ERROR)
     
     def previous_page(self):
         """Go to previous page."""
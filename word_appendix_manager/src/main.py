@@ -9,22 +9,37 @@ Professional desktop application for adding PDF appendices to Word documents.
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
-from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtWidgets import QApplication, QMessageBox, QSplashScreen
 from PySide6.QtCore import Qt, QDir
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QPixmap, QColor
 
-# Add src directory to Python path for imports
+# Add src directory to Python path for imports. This is the only place the
+# path is set up: gui, core, utils and config are imported as top-level
+# packages from src throughout the application
 src_dir = Path(__file__).parent
 if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
+# Root of the bundled resources, resolved once
+_RESOURCES_ROOT = Path(__file__).resolve().parent.parent / "resources"
+
 from utils.logger import setup_logging
 from utils.exceptions import ApplicationError
-from utils.theme_manager import ThemeManager
-from config.settings import AppSettings
-from gui.main_window import MainWindow
-from gui.controller import AppController
+
+# The theme manager, settings, main window and controller modules pull in the
+# full widget set, PyMuPDF and python-docx; they are imported once the splash
+# screen is up so the first paint does not wait for them
+
+
+def write_banner(banner):
+    """Write a console banner in a single write; skipped when stdout is not a terminal."""
+    if sys.stdout is None or not sys.stdout.isatty():
+        return
+    
+    sys.stdout.write(banner)
+    sys.stdout.flush()
 
 
 class WordAppendixManager:
@@ -36,6 +51,7 @@ class WordAppendixManager:
         self.controller = None
         self.settings = None
         self.theme_manager = None
+        self.splash = None
         
     def initialize_application(self):
         """Initialize the Qt application with proper settings."""
@@ -52,21 +68,40 @@ class WordAppendixManager:
     
         # Set application icon
         icon_path = self._get_resource_path("icons/app_icon.ico")
-        if icon_path and os.path.exists(icon_path):
+        if icon_path:
             self.app.setWindowIcon(QIcon(icon_path))
     
         return self.app
+    
+    def show_splash(self):
+        """Show a splash screen while the heavy application modules load."""
+        pixmap = QPixmap(360, 120)
+        pixmap.fill(QColor("#1976d2"))
+        
+        self.splash = QSplashScreen(pixmap)
+        self.splash.showMessage(
+            "Word Appendix Manager\nLoading...",
+            Qt.AlignCenter,
+            QColor("white")
+        )
+        self.splash.show()
+        
+        # Paint the splash before the imports block the event loop
+        self.app.processEvents()
 
     
     def initialize_components(self):
         """Initialize application components."""
         try:
-            # Setup logging
-            setup_logging()
+            from utils.theme_manager import ThemeManager
+            from config.settings import AppSettings
             
             # Load application settings
             self.settings = AppSettings()
             
+            # Setup logging
+            setup_logging(caller_info=self.settings.get('advanced.log_caller_info', True))
+            
             # Initialize theme manager
             self.theme_manager = ThemeManager(self.settings)
             
@@ -82,6 +117,9 @@ class WordAppendixManager:
     def create_main_window(self):
         """Create and configure the main application window."""
         try:
+            from gui.main_window import MainWindow
+            from gui.controller import AppController
+            
             self.main_window = MainWindow(settings=self.settings, theme_manager=self.theme_manager)
             
             # Create controller to handle business logic
@@ -89,6 +127,10 @@ class WordAppendixManager:
             
             self.main_window.show()
             
+            if self.splash:
+                self.splash.finish(self.main_window)
+                self.splash = None
+            
             # Center window on screen
             self._center_window()
             
@@ -109,14 +151,19 @@ class WordAppendixManager:
             window_geometry.moveCenter(center_point)
             self.main_window.move(window_geometry.topLeft())
     
-    def _get_resource_path(self, relative_path):
-        """Get absolute path to resource file."""
-        base_dir = Path(__file__).parent.parent
-        resource_path = base_dir / "resources" / relative_path
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_resource_path(relative_path):
+        """Get absolute path to resource file, checking each path only once."""
+        resource_path = _RESOURCES_ROOT / relative_path
         return str(resource_path) if resource_path.exists() else None
     
     def _show_error(self, message):
         """Show error message to user."""
+        if self.splash:
+            self.splash.close()
+            self.splash = None
+        
         if self.app:
             msg_box = QMessageBox()
             msg_box.setIcon(QMessageBox.Critical)
@@ -134,6 +181,8 @@ class WordAppendixManager:
             if not self.initialize_application():
                 return 1
             
+            self.show_splash()
+            
             # Initialize components
             if not self.initialize_components():
                 return 1
@@ -143,9 +192,11 @@ class WordAppendixManager:
                 return 1
             
             # Show startup message
-            print("🚀 Word Appendix Manager v1.0 - Started Successfully!")
-            print("📄 Ready to process Word documents with PDF appendices")
-            print("=" * 60)
+            write_banner(
+                "🚀 Word Appendix Manager v1.0 - Started Successfully!\n"
+                "📄 Ready to process Word documents with PDF appendices\n"
+                f"{'=' * 60}\n"
+            )
             
             # Run event loop
             return self.app.exec()
@@ -164,16 +215,18 @@ class WordAppendixManager:
 
 def main():
     """Application entry point."""
-    print("=" * 60)
-    print("🎯 WORD APPENDIX MANAGER v1.0")
-    print("📋 Professional PDF Appendix Tool for Word Documents")
-    print("⚡ Built with PySide6 & Python")
-    print("=" * 60)
+    write_banner(
+        f"{'=' * 60}\n"
+        "🎯 WORD APPENDIX MANAGER v1.0\n"
+        "📋 Professional PDF Appendix Tool for Word Documents\n"
+        "⚡ Built with PySide6 & Python\n"
+        f"{'=' * 60}\n"
+    )
     
     app_manager = WordAppendixManager()
     exit_code = app_manager.run()
     
-    print("👋 Word Appendix Manager - Goodbye!")
+    write_banner("👋 Word Appendix Manager - Goodbye!\n")
     sys.exit(exit_code)
 
 
@@ -6,6 +6,14 @@ Defines specific exceptions for different error scenarios in the application.
 from typing import Optional, Any
 
 
+def _details(extra_details: Optional[dict] = None, **values) -> dict:
+    """Build an exception details dict from the given values that are set, plus any extra details."""
+    details = {key: value for key, value in values.items() if value}
+    if extra_details:
+        details.update(extra_details)
+    return details
+
+
 class ApplicationError(Exception):
     """Base exception class for all application errors."""
     
@@ -13,7 +21,7 @@ class ApplicationError(Exception):
         super().__init__(message)
         self.message = message
         self.error_code = error_code or self.__class__.__name__
-        self.details = details or {}
+        self.details = {} if details is None else details
     
     def __str__(self):
         return f"[{self.error_code}] {self.message}"
@@ -32,13 +40,7 @@ class WordDocumentError(ApplicationError):
     """Raised when there are issues with Word document operations."""
     
     def __init__(self, message: str, document_path: Optional[str] = None, operation: Optional[str] = None):
-        details = {}
-        if document_path:
-            details["document_path"] = document_path
-        if operation:
-            details["operation"] = operation
-        
-        super().__init__(message, "WORD_ERROR", details)
+        super().__init__(message, "WORD_ERROR", _details(document_path=document_path, operation=operation))
 
 
 class WordNotAvailableError(WordDocumentError):
@@ -69,14 +71,9 @@ class WordDocumentLockError(WordDocumentError):
 class PDFError(ApplicationError):
     """Base class for PDF-related errors."""
     
-    def __init__(self, message: str, pdf_path: Optional[str] = None, operation: Optional[str] = None):
-        details = {}
-        if pdf_path:
-            details["pdf_path"] = pdf_path
-        if operation:
-            details["operation"] = operation
-        
-        super().__init__(message, "PDF_ERROR", details)
+    def __init__(self, message: str, pdf_path: Optional[str] = None, operation: Optional[str] = None,
+                 extra_details: Optional[dict] = None):
+        super().__init__(message, "PDF_ERROR", _details(extra_details, pdf_path=pdf_path, operation=operation))
 
 
 class PDFNotFoundError(PDFError):
@@ -102,12 +99,8 @@ class PDFTooLargeError(PDFError):
     
     def __init__(self, pdf_path: str, file_size_mb: float, max_size_mb: float):
         message = f"PDF file is too large: {file_size_mb:.1f}MB (max: {max_size_mb}MB)"
-        details = {
-            "file_size_mb": file_size_mb,
-            "max_size_mb": max_size_mb
-        }
-        super().__init__(message, pdf_path, "size_check")
-        self.details.update(details)
+        super().__init__(message, pdf_path, "size_check",
+                         {"file_size_mb": file_size_mb, "max_size_mb": max_size_mb})
 
 
 class PDFProcessingError(PDFError):
@@ -121,49 +114,30 @@ class AppendixError(ApplicationError):
     """Raised when there are issues with appendix operations."""
     
     def __init__(self, message: str, appendix_name: Optional[str] = None, operation: Optional[str] = None):
-        details = {}
-        if appendix_name:
-            details["appendix_name"] = appendix_name
-        if operation:
-            details["operation"] = operation
-        
-        super().__init__(message, "APPENDIX_ERROR", details)
+        super().__init__(message, "APPENDIX_ERROR", _details(appendix_name=appendix_name, operation=operation))
 
 
 class FileSystemError(ApplicationError):
     """Raised when there are file system operation errors."""
     
-    def __init__(self, message: str, file_path: Optional[str] = None, operation: Optional[str] = None):
-        details = {}
-        if file_path:
-            details["file_path"] = file_path
-        if operation:
-            details["operation"] = operation
-        
-        super().__init__(message, "FILESYSTEM_ERROR", details)
+    def __init__(self, message: str, file_path: Optional[str] = None, operation: Optional[str] = None,
+                 extra_details: Optional[dict] = None):
+        super().__init__(message, "FILESYSTEM_ERROR", _details(extra_details, file_path=file_path, operation=operation))
 
 
 class BackupError(FileSystemError):
     """Raised when backup operations fail."""
     
     def __init__(self, message: str, source_path: Optional[str] = None, backup_path: Optional[str] = None):
-        details = {}
-        if source_path:
-            details["source_path"] = source_path
-        if backup_path:
-            details["backup_path"] = backup_path
-        
-        super().__init__(message, operation="backup")
-        self.details.update(details)
+        super().__init__(message, operation="backup",
+                         extra_details=_details(source_path=source_path, backup_path=backup_path))
 
 
 class ValidationError(ApplicationError):
     """Raised when data validation fails."""
     
     def __init__(self, message: str, field_name: Optional[str] = None, field_value: Optional[Any] = None):
-        details = {}
-        if field_name:
-            details["field_name"] = field_name
+        details = _details(field_name=field_name)
         if field_value is not None:
             details["field_value"] = str(field_value)
         
@@ -174,8 +148,4 @@ class UserCancelledError(ApplicationError):
     """Raised when user cancels an operation."""
     
     def __init__(self, message: str = "Operation cancelled by user", operation: Optional[str] = None):
-        details = {}
-        if operation:
-            details["operation"] = operation
-        
-        super().__init__(message, "USER_CANCELLED", details)
\ No newline at end of file
+        super().__init__(message, "USER_CANCELLED", _details(operation=operation))
\ No newline at end of file
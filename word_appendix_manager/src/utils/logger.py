@@ -3,9 +3,12 @@ Logging Configuration and Utilities
 Provides structured logging for the Word Appendix Manager application.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -23,15 +26,27 @@ class ColoredFormatter(logging.Formatter):
         'ENDC': '\033[0m'        # End color
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names by level number, built once; the format string
+        # uses %(colorlevel)s so records are not rewritten and restored per call
+        end = self.COLORS['ENDC']
+        self._colored_levels = {
+            getattr(logging, name): f"{color}{name}{end}"
+            for name, color in self.COLORS.items() if name != 'ENDC'
+        }
+    
     def format(self, record):
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['ENDC']}"
-        
-        formatted = super().format(record)
-        record.levelname = levelname
-        
-        return formatted
+        record.colorlevel = self._colored_levels.get(record.levelno, record.levelname)
+        return super().format(record)
+
+
+@lru_cache(maxsize=1)
+def get_log_directory() -> Path:
+    """Get the logs directory, creating it on first use."""
+    log_dir = Path(__file__).resolve().parent.parent.parent / "logs"
+    log_dir.mkdir(exist_ok=True)
+    return log_dir
 
 
 def setup_logging(
@@ -39,36 +54,50 @@ def setup_logging(
     log_file: Optional[str] = None,
     console_logging: bool = True,
     max_file_size: int = 10 * 1024 * 1024,
-    backup_count: int = 5
+    backup_count: int = 5,
+    caller_info: bool = True
 ) -> logging.Logger:
-    """Setup application logging with both console and file handlers."""
+    """Setup application logging with both console and file handlers.
     
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    With caller_info False, a leaner format without module, function and
+    line number fields is used.
+    """
     
-    # Create logs directory
-    log_dir = Path(__file__).parent.parent.parent / "logs"
-    log_dir.mkdir(exist_ok=True)
+    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
     # Default log file path
     if log_file is None:
         timestamp = datetime.now().strftime("%Y%m%d")
-        log_file = log_dir / f"app_{timestamp}.log"
+        log_file = get_log_directory() / f"app_{timestamp}.log"
     
     # Create root logger
     logger = logging.getLogger("WordAppendixManager")
     logger.setLevel(numeric_level)
+    stop_logging()
     logger.handlers.clear()
+    handlers = []
     
     # Create formatters
+    if caller_info:
+        file_caller, console_caller = ' | %(module)s:%(funcName)s:%(lineno)d', ' | %(module)s:%(funcName)s'
+    else:
+        file_caller = console_caller = ''
     file_formatter = logging.Formatter(
-        fmt='%(asctime)s | %(name)s | %(levelname)s | %(module)s:%(funcName)s:%(lineno)d | %(message)s',
+        fmt=f'%(asctime)s | %(name)s | %(levelname)s{file_caller} | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    console_formatter = ColoredFormatter(
-        fmt='%(asctime)s | %(levelname)s | %(module)s:%(funcName)s | %(message)s',
-        datefmt='%H:%M:%S'
-    )
+    # Color codes only for a terminal; redirected output gets plain level names
+    if sys.stdout is not None and sys.stdout.isatty():
+        console_formatter = ColoredFormatter(
+            fmt=f'%(asctime)s | %(colorlevel)s{console_caller} | %(message)s',
+            datefmt='%H:%M:%S'
+        )
+    else:
+        console_formatter = logging.Formatter(
+            fmt=f'%(asctime)s | %(levelname)s{console_caller} | %(message)s',
+            datefmt='%H:%M:%S'
+        )
     
     # File handler
     if log_file:
@@ -80,14 +109,23 @@ def setup_logging(
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
     # Console handler
     if console_logging:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Callers only enqueue records; the file and console handlers run on the
+    # listener's thread, so disk and console I/O stay off the GUI thread
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    logger.queue_listener.start()
     
     # Add uncaught exception handler
     def handle_exception(exc_type, exc_value, exc_traceback):
@@ -99,14 +137,32 @@ def setup_logging(
     
     sys.excepthook = handle_exception
     
-    logger.info("=" * 60)
-    logger.info("Word Appendix Manager - Logging initialized")
-    logger.info(f"Log level: {log_level}")
-    logger.info("=" * 60)
+    # Banner as a single record
+    logger.info("\n".join((
+        "=" * 60,
+        "Word Appendix Manager - Logging initialized",
+        f"Log level: {log_level}",
+        "=" * 60
+    )))
     
     return logger
 
 
+def stop_logging():
+    """Stop the logging listener thread, writing out any queued records."""
+    logger = logging.getLogger("WordAppendixManager")
+    listener = getattr(logger, 'queue_listener', None)
+    if listener is not None:
+        logger.queue_listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+# Flush queued records on interpreter exit
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a specific module."""
     return logging.getLogger(f"WordAppendixManager.{name}")
@@ -115,9 +171,12 @@ def get_logger(name: str) -> logging.Logger:
 class LoggerMixin:
     """Mixin class to add logging capability to any class."""
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Look the logger up once per class; logging.getLogger takes the logging lock
+        cls._class_logger = get_logger(cls.__name__)
+    
     @property
     def logger(self) -> logging.Logger:
         """Get logger instance for this class."""
-        if not hasattr(self, '_logger'):
-            self._logger = get_logger(self.__class__.__name__)
-        return self._logger
+        return self._class_logger
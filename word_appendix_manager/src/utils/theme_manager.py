@@ -4,14 +4,34 @@ Handles theme loading and switching for the application.
 """
 
 import os
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QObject, Signal
 
 from utils.logger import get_logger, LoggerMixin
 
 
+@lru_cache(maxsize=1)
+def get_styles_directory() -> Path:
+    """Get the stylesheet resources directory, resolved once per process."""
+    # Get the src directory (where main.py is)
+    src_dir = Path(__file__).parent.parent
+    
+    # Go up one level to project root, then into resources/styles
+    resource_dir = src_dir.parent / "resources" / "styles"
+    
+    if not resource_dir.exists():
+        get_logger(__name__).warning("Resources directory not found: %s", resource_dir)
+        # Try alternative path (for packaged applications)
+        if hasattr(sys, '_MEIPASS'):
+            resource_dir = Path(sys._MEIPASS) / "resources" / "styles"
+    
+    return resource_dir
+
+
 class ThemeManager(QObject, LoggerMixin):
     """Manages application themes and styling."""
     
@@ -25,6 +45,36 @@ class ThemeManager(QObject, LoggerMixin):
         "system": None  # Will detect system theme
     }
     
+    # Color values for each theme
+    THEME_COLORS = {
+        "light": {
+            "primary": "#2196f3",
+            "secondary": "#f8f9fa",
+            "success": "#4caf50",
+            "warning": "#ff9800",
+            "error": "#f44336",
+            "info": "#2196f3",
+            "text_primary": "#212529",
+            "text_secondary": "#6c757d",
+            "bg_primary": "#ffffff",
+            "bg_secondary": "#f8f9fa",
+            "border": "#d0d0d0"
+        },
+        "dark": {
+            "primary": "#007acc",
+            "secondary": "#252526",
+            "success": "#4ec9b0",
+            "warning": "#ce9178",
+            "error": "#f48771",
+            "info": "#007acc",
+            "text_primary": "#cccccc",
+            "text_secondary": "#999999",
+            "bg_primary": "#1e1e1e",
+            "bg_secondary": "#252526",
+            "border": "#3e3e42"
+        }
+    }
+    
     def __init__(self, settings=None):
         super().__init__()
         self.settings = settings
@@ -34,30 +84,18 @@ class ThemeManager(QObject, LoggerMixin):
         
         # Cache loaded stylesheets
         self._stylesheet_cache = {}
+        self._custom_widgets_data = None  # UTF-8 bytes shared by all themes, read once
         
         self.logger.info("Theme manager initialized")
     
     def _get_resource_directory(self) -> Path:
         """Get the resources directory path."""
-        # Get the src directory (where main.py is)
-        src_dir = Path(__file__).parent.parent
-        
-        # Go up one level to project root, then into resources/styles
-        resource_dir = src_dir.parent / "resources" / "styles"
-        
-        if not resource_dir.exists():
-            self.logger.warning(f"Resources directory not found: {resource_dir}")
-            # Try alternative path (for packaged applications)
-            import sys
-            if hasattr(sys, '_MEIPASS'):
-                resource_dir = Path(sys._MEIPASS) / "resources" / "styles"
-        
-        return resource_dir
+        return get_styles_directory()
     
     def load_theme(self, theme_name: str) -> bool:
         """Load and apply a theme."""
         if theme_name not in self.THEMES:
-            self.logger.error(f"Unknown theme: {theme_name}")
+            self.logger.error("Unknown theme: %s", theme_name)
             return False
         
         try:
@@ -69,19 +107,21 @@ class ThemeManager(QObject, LoggerMixin):
             stylesheet = self._load_stylesheet(theme_name)
             
             if stylesheet:
-                # Apply to application
+                # Apply to application; QtWidgets is only needed once a theme is applied
+                from PySide6.QtWidgets import QApplication
+                
                 app = QApplication.instance()
                 if app:
                     app.setStyleSheet(stylesheet)
                     self.current_theme = theme_name
                     self.theme_changed.emit(theme_name)
-                    self.logger.info(f"Applied theme: {theme_name}")
+                    self.logger.info("Applied theme: %s", theme_name)
                     return True
             
             return False
             
         except Exception as e:
-            self.logger.error(f"Failed to load theme {theme_name}: {e}")
+            self.logger.error("Failed to load theme %s: %s", theme_name, e)
             return False
     
     def _load_stylesheet(self, theme_name: str) -> Optional[str]:
@@ -92,28 +132,28 @@ class ThemeManager(QObject, LoggerMixin):
         
         try:
             # Load custom widgets stylesheet (shared across themes)
-            custom_widgets_css = ""
-            if self.custom_widgets_path.exists():
-                with open(self.custom_widgets_path, 'r', encoding='utf-8') as f:
-                    custom_widgets_css = f.read()
-            else:
-                self.logger.warning(f"Custom widgets stylesheet not found: {self.custom_widgets_path}")
+            if self._custom_widgets_data is None:
+                try:
+                    self._custom_widgets_data = self.custom_widgets_path.read_bytes()
+                except FileNotFoundError:
+                    self.logger.warning("Custom widgets stylesheet not found: %s", self.custom_widgets_path)
+                    self._custom_widgets_data = b""
             
             # Load theme-specific stylesheet
             theme_file = self.THEMES.get(theme_name)
-            theme_css = ""
+            theme_data = b""
             
             if theme_file:
                 theme_path = self.resource_dir / theme_file
-                if theme_path.exists():
-                    with open(theme_path, 'r', encoding='utf-8') as f:
-                        theme_css = f.read()
-                else:
-                    self.logger.error(f"Theme file not found: {theme_path}")
+                try:
+                    theme_data = theme_path.read_bytes()
+                except FileNotFoundError:
+                    self.logger.error("Theme file not found: %s", theme_path)
                     return None
             
-            # Combine stylesheets: theme-specific first (for CSS variable definitions), then custom widgets
-            combined_stylesheet = theme_css + "\n\n" + custom_widgets_css
+            # Combine stylesheets: theme-specific first (for CSS variable definitions), then custom widgets;
+            # both files are UTF-8, so the combined bytes are decoded once
+            combined_stylesheet = b"\n\n".join((theme_data, self._custom_widgets_data)).decode('utf-8')
             
             # Cache the result
             self._stylesheet_cache[theme_name] = combined_stylesheet
@@ -121,7 +161,7 @@ class ThemeManager(QObject, LoggerMixin):
             return combined_stylesheet
             
         except Exception as e:
-            self.logger.error(f"Error loading stylesheet for {theme_name}: {e}")
+            self.logger.error("Error loading stylesheet for %s: %s", theme_name, e)
             return None
     
     def _detect_system_theme(self) -> str:
@@ -135,9 +175,10 @@ class ThemeManager(QObject, LoggerMixin):
                 palette = app.palette()
                 # Check if window background is dark
                 window_color = palette.color(QPalette.Window)
-                luminance = (0.299 * window_color.red() + 
-                           0.587 * window_color.green() + 
-                           0.114 * window_color.blue())
+                # Rec. 601 luma weights scaled to 256ths (77 + 150 + 29 = 256)
+                luminance = (77 * window_color.red() +
+                             150 * window_color.green() +
+                             29 * window_color.blue()) >> 8
                 
                 # If luminance is low, it's a dark theme
                 if luminance < 128:
@@ -148,7 +189,7 @@ class ThemeManager(QObject, LoggerMixin):
             return "light"
             
         except Exception as e:
-            self.logger.warning(f"Could not detect system theme: {e}")
+            self.logger.warning("Could not detect system theme: %s", e)
             return "light"
     
     def get_current_theme(self) -> str:
@@ -172,61 +213,29 @@ class ThemeManager(QObject, LoggerMixin):
         """Apply custom CSS to a specific widget."""
         try:
             widget.setStyleSheet(custom_css)
-            self.logger.debug(f"Applied custom stylesheet to {widget.__class__.__name__}")
+            self.logger.debug("Applied custom stylesheet to %s", widget.__class__.__name__)
         except Exception as e:
-            self.logger.error(f"Failed to apply custom stylesheet: {e}")
+            self.logger.error("Failed to apply custom stylesheet: %s", e)
     
     def get_theme_color(self, color_name: str) -> str:
         """Get a color value from the current theme."""
-        # Define color mappings for themes
-        theme_colors = {
-            "light": {
-                "primary": "#2196f3",
-                "secondary": "#f8f9fa",
-                "success": "#4caf50",
-                "warning": "#ff9800",
-                "error": "#f44336",
-                "info": "#2196f3",
-                "text_primary": "#212529",
-                "text_secondary": "#6c757d",
-                "bg_primary": "#ffffff",
-                "bg_secondary": "#f8f9fa",
-                "border": "#d0d0d0"
-            },
-            "dark": {
-                "primary": "#007acc",
-                "secondary": "#252526",
-                "success": "#4ec9b0",
-                "warning": "#ce9178",
-                "error": "#f48771",
-                "info": "#007acc",
-                "text_primary": "#cccccc",
-                "text_secondary": "#999999",
-                "bg_primary": "#1e1e1e",
-                "bg_secondary": "#252526",
-                "border": "#3e3e42"
-            }
-        }
-        
-        current_colors = theme_colors.get(self.current_theme, theme_colors["light"])
+        current_colors = self.THEME_COLORS.get(self.current_theme, self.THEME_COLORS["light"])
         return current_colors.get(color_name, "#000000")
     
     def create_inline_style(self, widget_type: str, properties: dict) -> str:
         """Create an inline stylesheet string."""
-        style_parts = []
-        for prop, value in properties.items():
-            # Convert Python-style property names to CSS
-            css_prop = prop.replace("_", "-")
-            style_parts.append(f"{css_prop}: {value}")
-        
-        return f"{widget_type} {{ {'; '.join(style_parts)}; }}"
+        # Convert Python-style property names to CSS
+        declarations = "; ".join(
+            f"{prop.replace('_', '-')}: {value}" for prop, value in properties.items()
+        )
+        return f"{widget_type} {{ {declarations}; }}"
     
     def save_theme_preference(self, theme_name: str):
         """Save theme preference to settings."""
         if self.settings:
             self.settings.ui_theme = theme_name
             self.settings.save_settings()
-            self.logger.info(f"Saved theme preference: {theme_name}")
+            self.logger.info("Saved theme preference: %s", theme_name)
     
     def load_saved_theme(self):
         """Load theme from saved settings."""
@@ -239,10 +248,15 @@ class ThemeManager(QObject, LoggerMixin):
 
 # Convenience function for getting theme manager instance
 _theme_manager_instance = None
+_theme_manager_lock = threading.Lock()
 
 def get_theme_manager(settings=None) -> ThemeManager:
     """Get or create the global theme manager instance."""
     global _theme_manager_instance
+    # Only the first calls take the lock; it keeps concurrent first calls from
+    # creating two managers
     if _theme_manager_instance is None:
-        _theme_manager_instance = ThemeManager(settings)
+        with _theme_manager_lock:
+            if _theme_manager_instance is None:
+                _theme_manager_instance = ThemeManager(settings)
     return _theme_manager_instance
\ No newline at end of file
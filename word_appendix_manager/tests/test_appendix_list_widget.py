@@ -0,0 +1,38 @@
+"""
+Tests for the appendix list label and row text helpers.
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from gui.widgets.appendix_list_widget import _alpha_label, _numeric_label, _row_text
+
+
+@pytest.mark.parametrize("index, label", [
+    (0, "Appendix A"),
+    (25, "Appendix Z"),
+    (26, "Appendix AA"),
+    (27, "Appendix AB"),
+    (51, "Appendix AZ"),
+    (52, "Appendix BA"),
+])
+def test_alpha_label(index, label):
+    assert _alpha_label(index) == label
+
+
+def test_numeric_label():
+    assert _numeric_label(0) == "1."
+    assert _numeric_label(9) == "10."
+
+
+def test_row_text():
+    assert _row_text("/docs/report.pdf", 12, 3.456, "portrait", 0) == (
+        "report.pdf", "12 pages • 3.5 MB • Portrait"
+    )
+
+
+def test_row_text_single_page_with_warnings():
+    assert _row_text("scan.pdf", 1, 0.04, "landscape", 2) == (
+        "scan.pdf", "1 page • 0.0 MB • Landscape • ⚠ 2 warning(s)"
+    )
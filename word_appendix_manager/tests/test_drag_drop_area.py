@@ -0,0 +1,43 @@
+"""
+Tests for the PDF path filtering used by the drag and drop area.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from gui.widgets.drag_drop_area import filter_pdf_paths
+
+
+def test_keeps_existing_pdf_files(tmp_path):
+    pdf_file = tmp_path / "report.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4")
+    assert filter_pdf_paths([str(pdf_file)]) == [os.path.normpath(str(pdf_file))]
+
+
+def test_accepts_upper_case_extension(tmp_path):
+    pdf_file = tmp_path / "REPORT.PDF"
+    pdf_file.write_bytes(b"%PDF-1.4")
+    assert filter_pdf_paths([str(pdf_file)]) == [str(pdf_file)]
+
+
+def test_rejects_non_pdf_missing_and_directory_paths(tmp_path):
+    text_file = tmp_path / "notes.txt"
+    text_file.write_text("notes")
+    pdf_directory = tmp_path / "folder.pdf"
+    pdf_directory.mkdir()
+    
+    paths = [str(text_file), str(tmp_path / "missing.pdf"), str(pdf_directory)]
+    assert filter_pdf_paths(paths) == []
+
+
+def test_normalizes_paths_and_keeps_order(tmp_path):
+    first = tmp_path / "b.pdf"
+    second = tmp_path / "a.pdf"
+    first.write_bytes(b"%PDF-1.4")
+    second.write_bytes(b"%PDF-1.4")
+    
+    paths = [str(tmp_path) + "/./b.pdf", str(second)]
+    assert filter_pdf_paths(paths) == [os.path.normpath(str(first)), os.path.normpath(str(second))]
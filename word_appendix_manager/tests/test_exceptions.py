@@ -0,0 +1,74 @@
+"""
+Tests for the application exception classes.
+"""
+
+from utils.exceptions import (
+    _details, ApplicationError, WordDocumentError, PDFError, PDFTooLargeError,
+    FileSystemError, BackupError, ValidationError
+)
+
+
+def test_details_keeps_only_set_values():
+    assert _details(pdf_path="a.pdf", operation=None, count=0) == {"pdf_path": "a.pdf"}
+
+
+def test_details_appends_extra_details():
+    details = _details({"file_size_mb": 0.0}, pdf_path="a.pdf")
+    assert details == {"pdf_path": "a.pdf", "file_size_mb": 0.0}
+
+
+def test_application_error_defaults():
+    error = ApplicationError("Something failed")
+    assert error.error_code == "ApplicationError"
+    assert error.details == {}
+    assert str(error) == "[ApplicationError] Something failed"
+
+
+def test_details_are_not_shared_between_exceptions():
+    first = WordDocumentError("first")
+    second = WordDocumentError("second")
+    first.details["extra"] = 1
+    assert second.details == {}
+
+
+def test_to_dict():
+    error = PDFError("Cannot read", "a.pdf", "read_file")
+    assert error.to_dict() == {
+        "error_type": "PDFError",
+        "error_code": "PDF_ERROR",
+        "message": "Cannot read",
+        "details": {"pdf_path": "a.pdf", "operation": "read_file"}
+    }
+
+
+def test_pdf_too_large_error():
+    error = PDFTooLargeError("big.pdf", 250.0, 200)
+    assert isinstance(error, PDFError)
+    assert error.error_code == "PDF_ERROR"
+    assert error.message == "PDF file is too large: 250.0MB (max: 200MB)"
+    assert error.details == {
+        "pdf_path": "big.pdf",
+        "operation": "size_check",
+        "file_size_mb": 250.0,
+        "max_size_mb": 200
+    }
+
+
+def test_backup_error():
+    error = BackupError("Backup failed", "doc.docx", "backup/doc.docx")
+    assert isinstance(error, FileSystemError)
+    assert error.to_dict() == {
+        "error_type": "BackupError",
+        "error_code": "FILESYSTEM_ERROR",
+        "message": "Backup failed",
+        "details": {"operation": "backup", "source_path": "doc.docx", "backup_path": "backup/doc.docx"}
+    }
+
+
+def test_backup_error_without_paths():
+    assert BackupError("Backup failed").details == {"operation": "backup"}
+
+
+def test_validation_error_keeps_falsy_field_value():
+    error = ValidationError("Invalid value", "max_pages", 0)
+    assert error.details == {"field_name": "max_pages", "field_value": "0"}